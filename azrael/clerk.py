@@ -289,52 +289,62 @@ class Clerk(config.AzraelProcess):
             if self.sock_cmd not in sock:
                 continue
 
-            # Read from ROUTER socket and perform sanity checks.
-            data = self.sock_cmd.recv_multipart()
-            assert len(data) == 3
-            self.last_addr, empty, msg = data[0], data[1], data[2]
-            if empty != b'':
-                self.logit.error('Expected empty frame')
-                continue
-            del data, empty
-
-            # The payload must be a valid JSON string.
-            with util.Timeit('clerk.runCmd:1'):
+            # Process all pending requests before polling the socket again.
+            while True:
                 try:
-                    msg = json.loads(msg.decode('utf8'))
-                except (ValueError, TypeError):
-                    ret = RetVal(False, 'JSON decoding error in Clerk', None)
+                    data = self.sock_cmd.recv_multipart(zmq.NOBLOCK)
+                except zmq.Again:
+                    break
+
+                # Sanity checks on the message read from the ROUTER socket.
+                assert len(data) == 3
+                self.last_addr, empty, msg = data[0], data[1], data[2]
+                if empty != b'':
+                    self.logit.error('Expected empty frame')
+                    continue
+                del data, empty
+
+                # The payload must be a valid JSON string.
+                with util.Timeit('clerk.runCmd:1'):
+                    try:
+                        msg = json.loads(msg.decode('utf8'))
+                    except (ValueError, TypeError):
+                        ret = RetVal(
+                            False, 'JSON decoding error in Clerk', None)
+                        self.returnToClient(self.last_addr, ret)
+                        del ret
+                        continue
+
+                # Sanity check: every message must contain at least a command
+                # word.
+                if not (('cmd' in msg) and ('data' in msg)):
+                    ret = RetVal(False, 'Invalid command format', None)
                     self.returnToClient(self.last_addr, ret)
                     del ret
                     continue
 
-            # Sanity check: every message must contain at least a command word.
-            if not (('cmd' in msg) and ('data' in msg)):
-                ret = RetVal(False, 'Invalid command format', None)
-                self.returnToClient(self.last_addr, ret)
-                del ret
-                continue
-
-            # Extract the command word and payload.
-            cmd, payload = msg['cmd'], msg['data']
-
-            with util.Timeit('clerk.runCmd:2-{}'.format(cmd)):
-                # The command word determines the action...
-                if cmd in self.codec:
-                    # Look up the decode-process-encode functions for the current
-                    # command word. The 'decode' part will interpret the JSON
-                    # string we just received, the 'process' part is a handle to a
-                    # method in this very Clerk instance, and 'encode' will convert
-                    # the values to a valid JSON string that will be returned to
-                    # the Client.
-                    dec, proc, enc = self.codec[cmd]
-
-                    # Run the Clerk function.
-                    self.runCommand(cmd, payload, dec, proc, enc)
-                else:
-                    # Unknown command word.
-                    ret = RetVal(False, 'Invalid command <{}>'.format(cmd), None)
-                    self.returnToClient(self.last_addr, ret)
+                # Extract the command word and payload.
+                cmd, payload = msg['cmd'], msg['data']
+
+                with util.Timeit('clerk.runCmd:2-{}'.format(cmd)):
+                    # The command word determines the action...
+                    if cmd in self.codec:
+                        # Look up the decode-process-encode functions for the
+                        # current command word. The 'decode' part will
+                        # interpret the JSON string we just received, the
+                        # 'process' part is a handle to a method in this very
+                        # Clerk instance, and 'encode' will convert the values
+                        # to a valid JSON string that will be returned to the
+                        # Client.
+                        dec, proc, enc = self.codec[cmd]
+
+                        # Run the Clerk function.
+                        self.runCommand(cmd, payload, dec, proc, enc)
+                    else:
+                        # Unknown command word.
+                        err = 'Invalid command <{}>'.format(cmd)
+                        ret = RetVal(False, err, None)
+                        self.returnToClient(self.last_addr, ret)
 
     @typecheck
     def returnToClient(self, addr, ret: RetVal, addToLog: bool=True):
@@ -751,12 +761,18 @@ class Clerk(config.AzraelProcess):
 
             # For every successfully added objects we will now tell Dibbler to
             # duplicate the fragment files and make them available at the
-            # instance URL for the respective object.
+            # instance URL for the respective object. Objects spawned from the
+            # same template share the same source files, which is why we
+            # compile a single mapping from every source file to all its
+            # destinations and let Dibbler fetch each source only once.
+            srcdst = {}
             for aid in valid:
-                if not self.dibbler.copy(dib_files[aid]).ok:
-                    msg = 'Dibbler could not copy the files {} for template <{}>'
-                    fnames = list(dib_files[aid].keys())
-                    self.logit.warning(msg.format(fnames, aid))
+                for src, dst in dib_files[aid].items():
+                    srcdst.setdefault(src, []).append(dst)
+            if not self.dibbler.copy(srcdst).ok:
+                msg = 'Dibbler could not copy the files {} for objects {}'
+                self.logit.warning(msg.format(sorted(srcdst), valid))
+            del srcdst
 
         # Publish the existence of the new objects.
         with util.Timeit('spawn:3 addCmds'):
@@ -965,8 +981,8 @@ class Clerk(config.AzraelProcess):
         leoAPI.addCmdBoosterForce(objID, force, torque)
         del ret, force, torque
 
-        # Factories will spawn their objects.
-        objIDs = []
+        # Compile the initial states of the objects the factories will spawn.
+        newObjects = []
         for partID, cmd in cmd_factories.items():
             # Template for this very factory.
             this = instance.factories[partID]
@@ -991,14 +1007,27 @@ class Clerk(config.AzraelProcess):
                     'rotation': tuple(sv_parent.rotation),
                 }
             }
-
-            # Spawn the actual object that this factory can create. Retain
-            # the objID as it will be returned to the caller.
-            ret = self.spawn([init])
+            newObjects.append(init)
+
+        # Spawn the objects of all factories with a single call. This fetches
+        # the templates, object IDs, and queues the Leonard commands once
+        # instead of once per factory. However, `spawn` is all-or-nothing, so
+        # if the batch fails (eg because one factory references a missing
+        # template) then spawn the objects one by one to ensure the other
+        # factories still work. Retain the objIDs as they will be returned to
+        # the caller.
+        objIDs = []
+        if len(newObjects) > 0:
+            ret = self.spawn(newObjects)
             if ret.ok:
-                objIDs.append(ret.data[0])
+                objIDs = list(ret.data)
             else:
-                self.logit.info('Factory could not spawn objects')
+                for init in newObjects:
+                    ret = self.spawn([init])
+                    if ret.ok:
+                        objIDs.append(ret.data[0])
+                    else:
+                        self.logit.info('Factory could not spawn objects')
 
         # Success. Return the IDs of all spawned objects.
         return RetVal(True, None, objIDs)
@@ -879,18 +879,17 @@ class DatastoreInMemory(DatastoreBase):
         :param dict doc: possibly nested dictionary.
         :param tuple prj: list of key_hierarchies.
         """
-        # Create a genuine copy that is independent from all the dictionaries
-        # in the original.
-        doc = copy.deepcopy(doc)
-
         # Iterate over all key hierarchies specified in ``prj``. Copy the
-        # respective values from the original `doc`.
+        # respective values from the original `doc`. Only the projected values
+        # are copied (not the entire document) to ensure the output is
+        # independent from the dictionaries in the original.
         out = {}
         for p in prj:
             try:
-                self.setKey(out, p, self.getKey(doc, p))
-            except KeyError:
+                value = self.getKey(doc, p)
+            except (KeyError, TypeError):
                 continue
+            self.setKey(out, p, copy.deepcopy(value))
         return out
 
 
@@ -1053,7 +1052,12 @@ class DatastoreMongo(DatastoreBase):
             self.logit.warning('Invalid PUT argument')
             return RetVal(False, 'Argument error', None)
 
-        ret = {}
+        # Nothing to do if there are no operations (Mongo complains about
+        # empty bulk writes).
+        if len(ops) == 0:
+            return RetVal(True, None, {})
+
+        aids, requests = [], []
         for aid, op in ops.items():
             # Unpack the data and make a genuine copy of it (jsut to avoid bad
             # surprised because dictionaries are mutable).
@@ -1065,18 +1069,21 @@ class DatastoreMongo(DatastoreBase):
             data['aid'] = aid
 
             # Insert the document only if it does not yet exist.
-            r = self.db.update_one(
+            aids.append(aid)
+            requests.append(pymongo.UpdateOne(
                 {'aid': aid},
                 {'$setOnInsert': data},
                 upsert=True
-            )
+            ))
 
-            # Specify the success value for this document depending on whether
-            # it already existed in the database or not.
-            if r.upserted_id is None:
-                ret[aid] = False
-            else:
-                ret[aid] = True
+        # Send all inserts to Mongo in a single bulk operation.
+        r = self.db.bulk_write(requests, ordered=False)
+
+        # Specify the success value for each document depending on whether it
+        # already existed in the database or not. Mongo only reports the
+        # (positional) index of the requests that actually inserted a document.
+        inserted = r.upserted_ids
+        ret = {aid: (idx in inserted) for idx, aid in enumerate(aids)}
         return RetVal(True, None, ret)
 
     @typecheck
@@ -37,7 +37,6 @@ import logging
 
 import azrael.config as config
 
-from IPython import embed as ipshell
 from azrael.aztypes import typecheck, RetVal
 
 
@@ -47,8 +46,8 @@ class Dibbler:
     """
     def __init__(self):
         # Create a GridFS handle.
-        db = config.getMongoClient(timeout=1.0)['AzraelGridDB']
-        self.fs = gridfs.GridFS(db)
+        self.db = config.getMongoClient(timeout=1.0)['AzraelGridDB']
+        self.fs = gridfs.GridFS(self.db)
 
         # Create a Class-specific logger.
         name = '.'.join([__name__, self.__class__.__name__])
@@ -60,9 +59,11 @@ class Dibbler:
 
         :return: Success
         """
-        # Find all versions of all files and delete everything.
-        for _ in self.fs.find():
-            self.fs.delete(_._id)
+        # Delete all versions of all files. GridFS stores the file meta data
+        # and the file content in two separate collections. Flush both with a
+        # single query each instead of deleting every file individually.
+        self.db.fs.files.delete_many({})
+        self.db.fs.chunks.delete_many({})
         return RetVal(True, None, None)
 
     def getNumFiles(self):
@@ -153,27 +154,39 @@ class Dibbler:
         still set).
 
         The 'ok' flag is only False if an error in the underlying file system
-        occurred.
+        occurred. Even then the returned dictionary still contains all the
+        files that could be read, ie. one corrupt file does not invalidate the
+        others.
 
         :param list[str] fname: the file names to retrieve.
         :return: dict[file_name: file_content]
         """
-        out = {}
-        for fname in fnames:
+        # Query the meta data of all requested files at once. Newer versions
+        # of the same file come first and shadow the older ones (the object
+        # ID breaks ties between versions uploaded in the same millisecond).
+        query = {'filename': {'$in': list(fnames)}}
+        sort = [('uploadDate', -1), ('_id', -1)]
+
+        out, seen, err = {}, set(), None
+        for gridout in self.fs.find(query, sort=sort):
+            fname = gridout.filename
+            if fname in seen:
+                continue
+            seen.add(fname)
             try:
-                out[fname] = self.fs.get_last_version(fname).read()
-            except gridfs.errors.NoFile as err:
-                msg = 'GridFS URL <{}> not found'.format(fname)
-                self.logit.info(msg)
+                out[fname] = gridout.read()
             except gridfs.errors.CorruptGridFile:
-                msg = 'Corrupt GridFS for URL <{}>'.format(fname)
-                self.logit.error(msg)
-                return RetVal(False, msg, None)
+                err = 'Corrupt GridFS for URL <{}>'.format(fname)
+                self.logit.error(err)
             except gridfs.errors.GridFSError:
-                msg = 'Unkown GridFS error'
-                self.logit.error(msg)
-                return RetVal(False, msg, None)
-        return RetVal(True, None, out)
+                err = 'Unkown GridFS error'
+                self.logit.error(err)
+
+        # Log the files we could not find.
+        for fname in set(fnames) - seen:
+            msg = 'GridFS URL <{}> not found'.format(fname)
+            self.logit.info(msg)
+        return RetVal(err is None, err, out)
 
     @typecheck
     def copy(self, srcdst: dict):
@@ -183,27 +196,39 @@ class Dibbler:
         This method only copies individual files. It does not recursivley copy
         directories.
 
+        The destination may either be a single file name or a list of file
+        names. The latter copies the same source file to several
+        destinations, eg. `{'src': ['dst1', 'dst2']}`.
+
         All destination names must be unique. If they are not then this method
         will return immediately with an error.
 
         :param dict[src:dst] srcdst: src/dst pairs.
         :return: int num_copied
         """
+        # Convert all destinations to lists.
+        srcdst = {src: [dst] if isinstance(dst, str) else list(dst)
+                  for src, dst in srcdst.items()}
+
         # Verify that all targets are unique.
-        dst = list(srcdst.values())
+        dst = [_ for dsts in srcdst.values() for _ in dsts]
         if sorted(dst) != sorted(list(set(dst))):
             return RetVal(False, 'Not all targets are unique', None)
 
+        # Fetch all source files at once. Copy whatever could be read, even
+        # if some of the files were corrupt.
+        files = self.get(list(srcdst.keys())).data
+
         # Copy each file from src to dst.
         num_copied = 0
-        for src, dst in srcdst.items():
-            try:
-                ret = self.get([src])
-                assert ret.ok and src in ret.data
-                assert self.put({dst: ret.data[src]}).ok
-                num_copied += 1
-            except AssertionError:
-                continue
+        for src, dsts in srcdst.items():
+            for dst in dsts:
+                try:
+                    assert src in files
+                    assert self.put({dst: files[src]}).ok
+                    num_copied += 1
+                except AssertionError:
+                    continue
         return RetVal(True, None, num_copied)
 
     @typecheck
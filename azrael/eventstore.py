@@ -63,6 +63,10 @@ class EventStore(threading.Thread):
         # Buffer for received messages is initially empty.
         self.messages = []
 
+        # Condition variable to wake up threads that wait for new messages
+        # (see `waitForMessages`).
+        self._cv_messages = threading.Condition()
+
         # We will periodically check this flag and terminate the thread once it
         # changes its value to True.
         self._terminate = False
@@ -76,6 +80,10 @@ class EventStore(threading.Thread):
         # We do not connect to RabbitMQ in the ctor (see `connect` method).
         self.rmq = None
 
+        # Signals that a connection to RabbitMQ exists (see
+        # `waitForConnection`).
+        self._evt_connected = threading.Event()
+
     def connect(self):
         """Connect to the Broker.
 
@@ -108,8 +116,9 @@ class EventStore(threading.Thread):
             return ret
 
         # Connection to RabbitMQ was successful - store the connection
-        # parameters in 'rmq'.
+        # parameters in 'rmq' and wake up all threads waiting for it.
         self.rmq = ret.data
+        self._evt_connected.set()
         return RetVal(True, None, None)
 
     def disconnect(self):
@@ -136,9 +145,26 @@ class EventStore(threading.Thread):
                 pass
 
         # Remove the handles.
+        self._evt_connected.clear()
         self.rmq = None
         return RetVal(True, None, None)
 
+    @typecheck
+    def waitForConnection(self, timeout: (int, float)):
+        """Block until a connection to the broker exists.
+
+        This method returns as soon as the connection has been established,
+        or after ``timeout`` Seconds, whichever comes first.
+
+        Args:
+            timeout (float): maximum time to wait in Seconds.
+        Return:
+            Success (RetVal): True if the connection exists.
+        """
+        if not self._evt_connected.wait(timeout):
+            return RetVal(False, 'Timeout', None)
+        return RetVal(True, None, None)
+
     def setupRabbitMQ(self):
         """Establish the connection with RabbitMQ.
 
@@ -206,8 +232,11 @@ class EventStore(threading.Thread):
         Args:
             See Pika documentation.
         """
-        # Add the message to the local cache.
-        self.messages.append((method.routing_key, body))
+        # Add the message to the local cache and wake up all threads that
+        # wait for it.
+        with self._cv_messages:
+            self.messages.append((method.routing_key, body))
+            self._cv_messages.notify_all()
 
         # Trigger the callback.
         self.onMessage()
@@ -246,10 +275,32 @@ class EventStore(threading.Thread):
         Returns:
             Success (RetVal): Always True.
         """
-        msg = list(self.messages)
-        self.messages = self.messages[len(msg):]
+        with self._cv_messages:
+            msg = list(self.messages)
+            self.messages = self.messages[len(msg):]
         return RetVal(True, None, msg)
 
+    @typecheck
+    def waitForMessages(self, numMessages: int, timeout: (int, float)):
+        """Block until at least ``numMessages`` messages are cached.
+
+        This method returns as soon as the messages have arrived, or after
+        ``timeout`` Seconds, whichever comes first. It does not remove any
+        messages from the cache (use :meth:`~getMessages` for that).
+
+        Args:
+            numMessages (int): minimum number of cached messages.
+            timeout (float): maximum time to wait in Seconds.
+        Return:
+            Success (RetVal): True if the messages arrived in time.
+        """
+        with self._cv_messages:
+            ok = self._cv_messages.wait_for(
+                lambda: len(self.messages) >= numMessages, timeout)
+        if not ok:
+            return RetVal(False, 'Timeout', None)
+        return RetVal(True, None, None)
+
     @typecheck
     def publish(self, topic: str, msg: bytes):
         """Publish the binary ``msg`` to ``topic``.
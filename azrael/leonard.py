@@ -78,61 +78,57 @@ def sweeping(data: dict, dim: str):
     :return: list of bodyID lists (eg [[1], [2, 3, 4]])
     :rtype: list[list]
     """
-    # Determine how many (xmin, xmax) tuples there will be to sort.
-    N = 0
-    try:
-        for v in data.values():
-            if len(v[dim]) == 0:
-                continue
+    # Compile the (min, max) tuples of all AABBs and the ID of the body they
+    # belong to into two flat lists.
+    ids, bounds = [], []
+    for k, v in data.items():
+        ids.extend([k] * len(v[dim]))
+        bounds.extend(v[dim])
+
+    # Nothing to do if there are no AABBs at all.
+    if len(bounds) == 0:
+        return RetVal(True, None, [])
 
-            # Sanity check: the AABB data must correspond to a matrix (this
-            # check is pretty much redundant because the sanity checks must
-            # happen in the calling function for performance reasons).
-            assert np.array(v[dim], np.float64).ndim == 2
-            N += len(v[dim])
-    except (ValueError, TypeError):
+    # Convert the bounds into an Nx2 matrix. The (mandatory) sanity check is
+    # performed on the entire matrix instead of each body individually.
+    try:
+        arr_pos = np.array(bounds, np.float64)
+        arr_ids = np.array(ids, np.int64)
+        assert arr_pos.ndim == 2 and arr_pos.shape[1] == 2
+    except (ValueError, TypeError, AssertionError):
         return RetVal(False, 'Invalid Sweeping inputs', None)
-    N *= 2
+    N = 2 * len(arr_pos)
 
-    # Pre-allocate arrays for start/stop position, objID, and an
-    # increment/decrement array used for convenient processing afterwards.
-    arr_pos = np.zeros(N, np.float64)
-    arr_ids = np.zeros(N, np.int64)
-    arr_inc = np.zeros(N, np.int8)
+    # Flatten the start/stop positions (they alternate) and create matching
+    # arrays for the objIDs and the increment/decrement values used for
+    # convenient processing afterwards.
+    arr_pos = arr_pos.ravel()
+    arr_ids = np.repeat(arr_ids, 2)
+    arr_inc = np.tile(np.array([+1, -1], np.int8), N // 2)
 
-    # Fill the arrays.
-    start = 0
-    for k, v in data.items():
-        for min_max_tuple in v[dim]:
-            stop = start + 2
-            arr_pos[start:stop] = min_max_tuple
-            arr_ids[start:stop] = k
-            arr_inc[start:stop] = [+1, -1]
-            start += 2
-
-    # Sort all three arrays according to the start/stop positions.
+    # Sort the IDs and increments according to the start/stop positions.
     idx = np.argsort(arr_pos)
     arr_ids = arr_ids[idx]
     arr_inc = arr_inc[idx]
 
-    # Sweep over the sorted data and compile the list of object sets.
-    out = []
-    sumVal = 0
-    setObjs = set()
-    for (inc, objID) in zip(arr_inc, arr_ids):
-        # Update the index variable and add the current object to the set (need
-        # to convert it from NumPy int to Python int first).
-        sumVal += inc
-        setObjs.add(objID)
-
-        # A new set of overlapping AABBs is complete whenever `sumVal`
-        # reaches zero.
-        if sumVal == 0:
-            out.append(setObjs)
-            setObjs = set()
-
-        # Safety check: sumVal can never be negative.
-        assert sumVal >= 0
+    # Sweep over the sorted data: the running sum of the increments counts the
+    # number of currently open AABBs. A new set of overlapping AABBs is
+    # complete whenever this count drops back to zero.
+    sumVal = np.cumsum(arr_inc, dtype=np.int64)
+
+    # Safety check: sumVal can never be negative.
+    assert np.all(sumVal >= 0)
+
+    # Split the sorted IDs into the sets of overlapping AABBs (the last set
+    # always ends at the last element because the total sum is zero).
+    ends = np.flatnonzero(sumVal == 0) + 1
+    out = [set(_.tolist()) for _ in np.split(arr_ids, ends[:-1])]
+
+    # The sets are already disjoint if every body occurs in exactly one of
+    # them. This is always the case for bodies with a single AABB and spares
+    # us the graph construction below.
+    if sum(len(_) for _ in out) == len(np.unique(arr_ids)):
+        return RetVal(True, None, [[str(a) for a in _] for _ in out])
 
     # Find all connected graphs. This will ensure that each body is in exactly
     # only collision set only, whereas right now this is not necessarily the
@@ -208,39 +204,37 @@ def computeCollisionSetsAABB(bodies: dict, AABBs: dict):
             bodies_ignored.append(objID)
             continue
 
-        # Iterate over all AABBs, rotate- and translate them in accordance with
-        # the body theyt are attached to, and compile the AABB boundaries.
+        # Stack all AABBs into a matrix, rotate- and translate them in
+        # accordance with the body they are attached to, and compile the AABB
+        # boundaries for all of them (and all three dimensions) at once.
         # Note: the AABBs are not re-computed here. The assumption is that the
         # AABB is large enough to contain their body at any rotation.
-        for aabb in sorted(AABBs[objID].values()):
-            # Sanity check: each AABB has exactly 6 entries. Since any given
-            # body can have multiple of them the number of values in the array
-            # must be an integer multiple of 6.
-            aabb = np.array(aabb, np.float64)
-            assert aabb.ndim == 1
-            assert len(aabb) % 6 == 0
-
-            # Convenience: unpack the AABB positions and half lengths. Apply
-            # the 'scale' to the half lengths.
-            pos_aabb, half_lengths = aabb[:3], aabb[3:]
-            half_lengths *= scale
-
-            # Skip the current AABB if at least on of its half lengths is zero.
-            if 0 in half_lengths:
-                continue
+        aabbs = np.array(sorted(AABBs[objID].values()), np.float64)
+
+        # Sanity check: each AABB has exactly 6 entries (position and half
+        # lengths).
+        assert aabbs.ndim == 2 and aabbs.shape[1] == 6
 
-            # Compute the AABB position in world coordinates. This takes into
-            # account the position-, rotation, and scale of the body.
-            pos = pos_rb + scale * (quat * pos_aabb)
+        # Convenience: unpack the AABB positions and half lengths. Apply the
+        # 'scale' to the half lengths.
+        pos_aabb, half_lengths = aabbs[:, :3], scale * aabbs[:, 3:]
 
-            # Compute the min/max value of the AABB value in world coordinates.
-            pmin = pos - half_lengths
-            pmax = pos + half_lengths
+        # Skip all AABBs where at least one of the half lengths is zero.
+        keep = np.all(half_lengths != 0, axis=1)
+        pos_aabb, half_lengths = pos_aabb[keep], half_lengths[keep]
 
-            # Store the result for this AABB.
-            sweep_data[objID]['x'].append([pmin[0], pmax[0]])
-            sweep_data[objID]['y'].append([pmin[1], pmax[1]])
-            sweep_data[objID]['z'].append([pmin[2], pmax[2]])
+        # Compute the AABB positions in world coordinates. This takes into
+        # account the position-, rotation, and scale of the body.
+        mat_rot = quat.toMatrix()[:3, :3]
+        pos = pos_rb + scale * pos_aabb.dot(mat_rot.T)
+
+        # Compute the min/max value of the AABBs in world coordinates and
+        # store them as [min, max] pairs for each dimension.
+        pmin = pos - half_lengths
+        pmax = pos + half_lengths
+        for idx, dim in enumerate('xyz'):
+            sweep_data[objID][dim] = np.column_stack(
+                (pmin[:, idx], pmax[:, idx])).tolist()
 
         # If no AABB was constructed (ie all AABBs contained at least one half
         # length that was zero) then merely add the object to the 'ignore'
@@ -254,9 +248,13 @@ def computeCollisionSetsAABB(bodies: dict, AABBs: dict):
     stage_0 = sweeping(sweep_data, 'x').data
 
     # Iterate over all the just found sets. For each, determine the sets that
-    # overlap in the 'y' dimension.
+    # overlap in the 'y' dimension. Sets with only a single body cannot be
+    # split any further and are passed through unchanged.
     stage_1 = []
     for subset in stage_0:
+        if len(subset) == 1:
+            stage_1.append(subset)
+            continue
         res = sweeping({k: sweep_data[k] for k in subset}, 'y')
         stage_1.extend(res.data)
 
@@ -264,6 +262,9 @@ def computeCollisionSetsAABB(bodies: dict, AABBs: dict):
     # each, determine which also overlap in the 'z' dimension.
     stage_2 = []
     for subset in stage_1:
+        if len(subset) == 1:
+            stage_2.append(subset)
+            continue
         res = sweeping({k: sweep_data[k] for k in subset}, 'z')
         stage_2.extend(res.data)
 
@@ -1042,7 +1043,8 @@ class LeonardDistributedZeroMQ(LeonardBase):
         # Log the number of created collision sets.
         util.logMetricQty('#CollSets', len(collSets))
 
-        # Put each collision set into its own Work Package.
+        # Put each collision set into its own Work Package. Pickle each Work
+        # Package only once because it may be sent to several Workers.
         with util.Timeit('Leonard:1.3  CreateWPs'):
             all_WPs = {}
             for subset in collSets:
@@ -1052,7 +1054,8 @@ class LeonardDistributedZeroMQ(LeonardBase):
                 if not ret.ok:
                     self.logit.error(ret.msg)
                     return
-                all_WPs[ret.data['wpid']] = ret.data
+                all_WPs[ret.data['wpid']] = pickle.dumps(
+                    ret.data, pickle.HIGHEST_PROTOCOL)
 
         with util.Timeit('Leonard:1.4  WPSendRecv'):
             wpIdx = 0
@@ -1099,8 +1102,8 @@ class LeonardDistributedZeroMQ(LeonardBase):
                 wp = all_WPs[worklist[wpIdx]]
                 wpIdx += 1
 
-                # Send the Work Package to the Worker.
-                self.sock.send(pickle.dumps(wp))
+                # Send the (already pickled) Work Package to the Worker.
+                self.sock.send(wp)
 
         # Synchronise the local cache back to the database.
         with util.Timeit('Leonard:1.5  syncObjects'):
@@ -1400,7 +1403,7 @@ class LeonardWorkerZeroMQ(config.AzraelProcess):
                 wpdata = self.computePhysicsForWorkPackage(wpdata)
 
             # Pack up the Work Package and send it back to Leonard.
-            sock.send(pickle.dumps(wpdata))
+            sock.send(pickle.dumps(wpdata, pickle.HIGHEST_PROTOCOL))
 
             # Count the number of Work Packages we have processed.
             numSteps += 1
@@ -28,7 +28,7 @@ clients.
 The JSON only protocoly should make it possible to write clients in other
 languages.
 """
-import base64
+import binascii
 import jsonschema
 import azutils
 import azrael.azschemas
@@ -72,7 +72,7 @@ def ToClerk_AddTemplates_Decode(payload: dict):
 
     # Convenience.
     T = aztypes.Template
-    dec = base64.b64decode
+    dec = binascii.a2b_base64
     with azutils.Timeit('clerk.decode'):
         decoded = []
         # Iterate over all templates.
@@ -221,7 +221,7 @@ def FromClerk_GetFragments_Encode(geo):
 @typecheck
 def ToClerk_SetFragments_Decode(payload: dict):
     def dec(filedata):
-        return base64.b64decode(filedata.encode('utf8'))
+        return binascii.a2b_base64(filedata.encode('utf8'))
 
     # Undo the Base64 encoding.
     for objID in payload['fragupdates']:
@@ -125,11 +125,13 @@ def getFragRaw(scale=1, pos=(0, 0, 0), rot=(0, 0, 0, 1)):
     """
     Convenience function: return typical RAW fragment.
     """
-    # Create a random RAW fragment.
+    # Create a random RAW fragment. Draw all random numbers at once and split
+    # them into vertices, UV coordinates, and colours.
+    data = np.random.randint(0, 100, 9 + 6 + 3).tolist()
     model = {
-        'vert': np.random.randint(0, 100, 9).tolist(),
-        'uv': np.random.randint(0, 100, 6).tolist(),
-        'rgb': np.random.randint(0, 100, 3).tolist()
+        'vert': data[:9],
+        'uv': data[9:15],
+        'rgb': data[15:]
     }
 
     # Make it compatible with HTTP transport.
@@ -151,10 +153,10 @@ def getFragDae(scale=1, pos=(0, 0, 0), rot=(0, 0, 0, 1)):
     """
     Convenience function: return typical Collada fragment.
     """
-    # Create a random Collada file and two textures.
-    dae_file = bytes(np.random.randint(0, 100, 3).astype(np.uint8))
-    dae_rgb1 = bytes(np.random.randint(0, 100, 3).astype(np.uint8))
-    dae_rgb2 = bytes(np.random.randint(0, 100, 3).astype(np.uint8))
+    # Create a random Collada file and two textures (all from a single batch
+    # of random numbers).
+    data = np.random.randint(0, 100, 9).astype(np.uint8)
+    dae_file, dae_rgb1, dae_rgb2 = [bytes(_) for _ in data.reshape(3, 3)]
 
     # Create a dictionary of all the files that constitute this model.
     files = {
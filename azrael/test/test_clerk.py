@@ -858,6 +858,46 @@ class TestClerk:
         assert np.allclose(body_3.position, pos_1)
         assert np.allclose(body_3.rotation, [0, 0, 0, 1])
 
+    def test_controlParts_Factories_missing_template(self):
+        """
+        A factory that references a non-existing template must not prevent
+        the other factories from spawning their objects.
+        """
+        # Convenience.
+        clerk = self.clerk
+
+        # Define a template with two factories. Only the first one references
+        # an existing template.
+        objID_1 = '1'
+        factories = {
+            '0': aztypes.Factory(position=(0, 0, 0), direction=(1, 0, 0),
+                                 templateID='_templateBox',
+                                 exit_speed=[0.1, 0.5]),
+            '1': aztypes.Factory(position=(0, 0, 0), direction=(0, 1, 0),
+                                 templateID='does_not_exist',
+                                 exit_speed=[1, 5])
+        }
+
+        # Add the template to Azrael and spawn one instance.
+        temp = getTemplate('t1', factories=factories)
+        assert clerk.addTemplates([temp]).data == {'t1': True}
+        ret = clerk.spawn([{'templateID': temp.aid}])
+        assert (ret.ok, ret.data) == (True, [objID_1])
+        del ret, temp, factories
+
+        # Activate both factories. Only the first one must have spawned an
+        # object.
+        cmd_f = {
+            '0': aztypes.CmdFactory(exit_speed=0.2),
+            '1': aztypes.CmdFactory(exit_speed=2),
+        }
+        ok, _, spawnedIDs = clerk.controlParts(objID_1, {}, cmd_f)
+        assert (ok, spawnedIDs) == (True, ['2'])
+
+        # The spawned object must exist.
+        ret = clerk.getRigidBodyData(['2'])
+        assert ret.ok and ret.data['2'] is not None
+
     def test_controlParts_Factories_moving(self):
         """
         Create a template with factories and send control commands to them.
@@ -2124,8 +2164,16 @@ class TestClerkEnd2End:
         azrael.datastore.init(flush=False)
         cls.clerk = azrael.clerk.Clerk()
 
+        # Start a single WebServer process for all tests in this class. It
+        # holds no state of its own (it merely relays Dibbler's files) and
+        # can thus be shared.
+        cls.web = azrael.web.WebServer()
+        cls.web.start()
+
     @classmethod
     def teardown_class(cls):
+        cls.web.terminate()
+        cls.web.join()
         killAzrael()
 
     def setup_method(self, method):
@@ -2133,12 +2181,8 @@ class TestClerkEnd2End:
         self.dibbler.reset()
         azrael.datastore.init(flush=True)
 
-        self.web = azrael.web.WebServer()
-        self.web.start()
-
     def teardown_method(self, method):
-        self.web.terminate()
-        self.web.join()
+        pass
 
     def downloadURL(self, url):
         for ii in range(10):
@@ -21,6 +21,10 @@ import azrael.datastore as datastore
 
 from IPython import embed as ipshell
 
+# Nested document for the tests of the key helpers in `DatastoreInMemory`. The
+# tests modify their own copy of it.
+_SRC_NESTED = {'x': 1, 'a': {'b': 2}, 'c': {'d': {'e': 3}}}
+
 
 class TestAtomicCounter:
     @classmethod
@@ -52,11 +56,10 @@ class TestAtomicCounter:
         ret = datastore.getUniqueObjectIDs(1)
         assert ret.ok and ret.data == ['1']
 
-        # Ask for several new object IDs.
-        for ii in range(5):
-            ret = datastore.getUniqueObjectIDs(1)
-            assert ret.ok
-            assert ret.data == [str(ii + 2)]
+        # Ask for several new object IDs in a single call.
+        ret = datastore.getUniqueObjectIDs(5)
+        assert ret.ok
+        assert ret.data == ['2', '3', '4', '5', '6']
 
         # Reset Azrael. Verify that all counters start at '0' again.
         datastore.init(flush=True)
@@ -95,14 +98,17 @@ class TestAllDatastoreBackends:
         datastore.DatastoreInMemory,
         datastore.DatastoreMongo,
     ]
+    all_engine_names = [_.__name__ for _ in all_engines]
 
     @classmethod
     def setup_class(cls):
-        pass
+        # Datastore instance for each backend. The tests share them to avoid
+        # re-connecting to the database for every test (see `getDatastore`).
+        cls.datastores = {}
 
     @classmethod
     def teardown_class(cls):
-        pass
+        cls.datastores.clear()
 
     def setup_method(self, method):
         pass
@@ -110,12 +116,22 @@ class TestAllDatastoreBackends:
     def teardown_method(self, method):
         pass
 
-    @pytest.mark.parametrize('clsDatabase', all_engines)
+    def getDatastore(self, clsDatabase):
+        """
+        Return the shared ``clsDatabase`` instance (create it if necessary).
+
+        This method does *not* reset the content of the datastore.
+        """
+        if clsDatabase not in self.datastores:
+            self.datastores[clsDatabase] = clsDatabase(name=('test1', 'test2'))
+        return self.datastores[clsDatabase]
+
+    @pytest.mark.parametrize('clsDatabase', all_engines, ids=all_engine_names)
     def test_reset(self, clsDatabase):
         """
         Add data and verify that 'reset' flushes it.
         """
-        db = clsDatabase(name=('test1', 'test2'))
+        db = self.getDatastore(clsDatabase)
 
         # Reset the database and verify that it is empty.
         assert db.reset().ok
@@ -130,12 +146,12 @@ class TestAllDatastoreBackends:
         assert db.reset() == (True, None, None)
         assert db.count() == (True, None, 0)
 
-    @pytest.mark.parametrize('clsDatabase', all_engines)
+    @pytest.mark.parametrize('clsDatabase', all_engines, ids=all_engine_names)
     def test_add_get(self, clsDatabase):
         """
         Add data, then fetch it back.
         """
-        db = clsDatabase(name=('test1', 'test2'))
+        db = self.getDatastore(clsDatabase)
 
         # Reset the database and verify that it is empty.
         assert db.reset().ok and db.count().data == 0
@@ -167,14 +183,14 @@ class TestAllDatastoreBackends:
 
         assert db.reset().ok and (db.count().data == 0)
 
-    @pytest.mark.parametrize('clsDatabase', all_engines)
+    @pytest.mark.parametrize('clsDatabase', all_engines, ids=all_engine_names)
     def test_put(self, clsDatabase):
         """
         Attempt to insert new documents. This must succeed when the database
         does not yet contain an object with the same AID. Otherwise the
         database content must not be modified.
         """
-        db = clsDatabase(name=('test1', 'test2'))
+        db = self.getDatastore(clsDatabase)
         aid1 = '1'
         aid2 = '2'
 
@@ -217,12 +233,12 @@ class TestAllDatastoreBackends:
         assert ret.ok
         assert ret.data == {aid1: {'key1': 'value1'}, aid2: {'key4': 'value4'}}
 
-    @pytest.mark.parametrize('clsDatabase', all_engines)
+    @pytest.mark.parametrize('clsDatabase', all_engines, ids=all_engine_names)
     def test_replace(self, clsDatabase):
         """
         Attempt to replace existing and non-existing documents.
         """
-        db = clsDatabase(name=('test1', 'test2'))
+        db = self.getDatastore(clsDatabase)
 
         # ---------------------------------------------------------------------
         # Replacing a non-existing document must do nothing.
@@ -266,7 +282,7 @@ class TestAllDatastoreBackends:
         assert ret.ok
         assert ret.data == {'1': {'key3': 'value3'}, '2': None}
 
-    @pytest.mark.parametrize('clsDatabase', all_engines)
+    @pytest.mark.parametrize('clsDatabase', all_engines, ids=all_engine_names)
     def test_put_boolean_return(self, clsDatabase):
         """
         In Python `1 == 1 == True` and `0 == 0 == False`. The API
@@ -275,7 +291,7 @@ class TestAllDatastoreBackends:
         usually alright and yet the problem did arise. This test will therefore
         explicity verify that the return values are bools not integers.
         """
-        db = clsDatabase(name=('test1', 'test2'))
+        db = self.getDatastore(clsDatabase)
 
         # Empty database: put must insert a new document.
         assert db.reset().ok and db.count().data == 0
@@ -294,12 +310,12 @@ class TestAllDatastoreBackends:
         assert ret.msg is None
         assert ret.data['1'] is False
 
-    @pytest.mark.parametrize('clsDatabase', all_engines)
+    @pytest.mark.parametrize('clsDatabase', all_engines, ids=all_engine_names)
     def test_getMulti_getAll(self, clsDatabase):
         """
         Insert some documents. Then query them in batches.
         """
-        db = clsDatabase(name=('test1', 'test2'))
+        db = self.getDatastore(clsDatabase)
 
         # Empty database: unconditonal put must succeed.
         assert db.reset().ok and db.count().data == 0
@@ -334,12 +350,12 @@ class TestAllDatastoreBackends:
         # asked for all documents.
         assert db.getAll() == db.getMulti(['1', '2', '3', '4'])
 
-    @pytest.mark.parametrize('clsDatabase', all_engines)
+    @pytest.mark.parametrize('clsDatabase', all_engines, ids=all_engine_names)
     def test_remove(self, clsDatabase):
         """
         Insert some documents. Then delete them.
         """
-        db = clsDatabase(name=('test1', 'test2'))
+        db = self.getDatastore(clsDatabase)
 
         # Empty database: unconditonal put must succeed.
         assert db.reset().ok and db.count().data == 0
@@ -369,12 +385,12 @@ class TestAllDatastoreBackends:
         assert db.remove(['1', '4']) == (True, None, 1)
         assert db.count() == (True, None, 0)
 
-    @pytest.mark.parametrize('clsDatabase', all_engines)
+    @pytest.mark.parametrize('clsDatabase', all_engines, ids=all_engine_names)
     def test_allKeys(self, clsDatabase):
         """
         Verify the allKeys method.
         """
-        db = clsDatabase(name=('test1', 'test2'))
+        db = self.getDatastore(clsDatabase)
 
         # Empty database: unconditonal put must succeed.
         assert db.reset().ok and db.count().data == 0
@@ -397,12 +413,12 @@ class TestAllDatastoreBackends:
         assert ret.ok
         assert sorted(ret.data) == ['2', '4']
 
-    @pytest.mark.parametrize('clsDatabase', all_engines)
+    @pytest.mark.parametrize('clsDatabase', all_engines, ids=all_engine_names)
     def test_get_with_projections(self, clsDatabase):
         """
         Add data and verify that 'reset' flushes it.
         """
-        db = clsDatabase(name=('test1', 'test2'))
+        db = self.getDatastore(clsDatabase)
 
         # Reset the database and verify that it is empty.
         assert db.reset().ok and db.count().data == 0
@@ -455,12 +471,12 @@ class TestAllDatastoreBackends:
         for prj in projections:
             assert db.getMulti(['1'], prj) == db.getAll(prj)
 
-    @pytest.mark.parametrize('clsDatabase', all_engines)
+    @pytest.mark.parametrize('clsDatabase', all_engines, ids=all_engine_names)
     def test_modify_single(self, clsDatabase):
         """
         Insert a single document and modify it.
         """
-        db = clsDatabase(name=('test1', 'test2'))
+        db = self.getDatastore(clsDatabase)
 
         # Reset the database and verify that it is empty.
         assert db.reset().ok and db.count().data == 0
@@ -496,12 +512,12 @@ class TestAllDatastoreBackends:
         }
         assert ret.data == ref
 
-    @pytest.mark.parametrize('clsDatabase', all_engines)
+    @pytest.mark.parametrize('clsDatabase', all_engines, ids=all_engine_names)
     def test_atomic_counter(self, clsDatabase):
         """
         Create an atomic counter and increment it.
         """
-        db = clsDatabase(name=('test1', 'test2'))
+        db = self.getDatastore(clsDatabase)
 
         # Reset the database and verify that it is empty.
         assert db.reset().ok and db.count().data == 0
@@ -562,47 +578,59 @@ class TestDatastoreInMemory:
     def teardown_method(self, method):
         pass
 
-    def test_projection(self):
+    @pytest.mark.parametrize('prj, ref', [
+        ([['z']], {}),
+        ([['x']], {'x': 1}),
+        ([['x'], ['a']], {'x': 1, 'a': {'b0': 2, 'b1': 3}}),
+        ([['x'], ['a', 'b0']], {'x': 1, 'a': {'b0': 2}}),
+        ([['x'], ['a', 'b5']], {'x': 1}),
+        ([['c']], {'c': {'d': {'e': 3}}}),
+        ([['c', 'd']], {'c': {'d': {'e': 3}}}),
+        ([['c', 'd', 'e']], {'c': {'d': {'e': 3}}}),
+        ([['c', 'd', 'blah']], {}),
+        ([['x', 'y']], {}),
+    ])
+    def test_projection(self, prj, ref):
         """
         The projection operator must only return the specified subset of
         fields. The fields can specify a key in a nested JSON hierarchy.
         """
         src = {'x': 1, 'a': {'b0': 2, 'b1': 3}, 'c': {'d': {'e': 3}}}
-        assert self.db.project(src, [['z']]) == {}
-        assert self.db.project(src, [['x']]) == {'x': 1}
-        assert self.db.project(src, [['x'], ['a']]) == {'x': 1, 'a': {'b0': 2, 'b1': 3}}
-        assert self.db.project(src, [['x'], ['a', 'b0']]) == {'x': 1, 'a': {'b0': 2}}
-        assert self.db.project(src, [['x'], ['a', 'b5']]) == {'x': 1}
-        assert self.db.project(src, [['c']]) == {'c': {'d': {'e': 3}}}
-        assert self.db.project(src, [['c', 'd']]) == {'c': {'d': {'e': 3}}}
-        assert self.db.project(src, [['c', 'd', 'e']]) == {'c': {'d': {'e': 3}}}
-        assert self.db.project(src, [['c', 'd', 'blah']]) == {}
-
-    def test_hasKey(self):
-        """
-        'delKey' is a helper function in the InMemory data store. It returns
+        out = self.db.project(src, prj)
+        assert out == ref
+
+        # The output must not share any (mutable) values with the source.
+        if 'a' in out:
+            out['a']['b0'] = -1
+            assert src['a']['b0'] == 2
+
+    @pytest.mark.parametrize('key, ref', [
+        (['z'], False),
+        (['x', 'a'], False),
+        (['a', 'x'], False),
+        (['x'], True),
+        (['a'], True),
+        (['c'], True),
+        (['a', 'b'], True),
+        (['c', 'd'], True),
+        (['c', 'd', 'e'], True),
+    ])
+    def test_hasKey(self, key, ref):
+        """
+        'hasKey' is a helper function in the InMemory data store. It returns
         True if a (possibly) nested key exists in the document structure.
         """
-        src = {'x': 1, 'a': {'b': 2}, 'c': {'d': {'e': 3}}}
-        assert not self.db.hasKey(src, ['z'])
-        assert not self.db.hasKey(src, ['x', 'a'])
-        assert not self.db.hasKey(src, ['a', 'x'])
-        assert self.db.hasKey(src, ['x'])
-        assert self.db.hasKey(src, ['a'])
-        assert self.db.hasKey(src, ['c'])
-        assert self.db.hasKey(src, ['a', 'b'])
-        assert self.db.hasKey(src, ['c', 'd'])
-        assert self.db.hasKey(src, ['c', 'd', 'e'])
+        assert self.db.hasKey(_SRC_NESTED, key) is ref
 
     def test_delKey(self):
         """
         'delKey' is a helper function in the InMemory data store. It must
         remove the specified key if it exists, and do nothing if not.
         """
-        src = {'x': 1, 'a': {'b': 2}, 'c': {'d': {'e': 3}}}
+        src = copy.deepcopy(_SRC_NESTED)
 
         self.db.delKey(src, ['z'])
-        assert src == {'x': 1, 'a': {'b': 2}, 'c': {'d': {'e': 3}}}
+        assert src == _SRC_NESTED
 
         self.db.delKey(src, ['x'])
         assert src == {'a': {'b': 2}, 'c': {'d': {'e': 3}}}
@@ -621,7 +649,7 @@ class TestDatastoreInMemory:
         'setKey' is a helper function in the InMemory data store. It must
         create/overwrite the specified key in the (nested) JSON document.
         """
-        src = {'x': 1, 'a': {'b': 2}, 'c': {'d': {'e': 3}}}
+        src = copy.deepcopy(_SRC_NESTED)
 
         self.db.setKey(src, ['z'], -1)
         assert src == {'x': 1, 'a': {'b': 2}, 'c': {'d': {'e': 3}}, 'z': -1}
@@ -14,14 +14,8 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with Azrael. If not, see <http://www.gnu.org/licenses/>.
-import json
-import pytest
 import azrael.dibbler
 
-import azrael.config as config
-from IPython import embed as ipshell
-from azrael.test.test import getTemplate, getFragRaw, getFragDae
-
 
 class TestDibbler:
     @classmethod
@@ -143,6 +137,11 @@ class TestDibbler:
             '/newdir/dst': b'dst'
         }
 
+        # Copy one file to several destinations at once.
+        assert dibbler.copy({'src': ['/a/src', '/b/src']}) == (True, None, 2)
+        ret = dibbler.get(['/a/src', '/b/src'])
+        assert ret.ok and ret.data == {'/a/src': b'src', '/b/src': b'src'}
+
     def test_remove_files_individual(self):
         """
         Create one file, then copy it to another location.
@@ -203,6 +202,31 @@ class TestDibbler:
         # Attempt to copy both files to the same target name.
         assert not dibbler.copy({'foo': 'blah', 'bar': 'blah'}).ok
 
+        # The targets must also be unique across multiple destinations.
+        assert not dibbler.copy({'foo': ['blah', 'x'], 'bar': ['blah']}).ok
+        assert not dibbler.copy({'foo': ['blah', 'blah']}).ok
+
+    def test_get_copy_corrupt_file(self):
+        """
+        A corrupt file must not prevent Dibbler from fetching, or copying, the
+        other files in the same request.
+        """
+        dibbler = self.dibbler
+        assert dibbler.getNumFiles() == (True, None, 0)
+
+        # Create two files, then corrupt 'bar' by deleting its content.
+        assert dibbler.put({'foo': b'foo', 'bar': b'bar'}).ok
+        doc = dibbler.db.fs.files.find_one({'filename': 'bar'})
+        dibbler.db.fs.chunks.delete_many({'files_id': doc['_id']})
+
+        # Fetching both files must report the error but still return 'foo'.
+        ok, _, data = dibbler.get(['foo', 'bar'])
+        assert (ok, data) == (False, {'foo': b'foo'})
+
+        # Only 'foo' can be copied.
+        assert dibbler.copy({'foo': 'x', 'bar': 'y'}) == (True, None, 1)
+        assert dibbler.get(['x', 'y']) == (True, None, {'x': b'foo'})
+
     def test_remove_directory(self):
         """
         Remove all files with common prefix.
@@ -18,6 +18,7 @@ import json
 import time
 import pika
 import pytest
+import threading
 import unittest.mock as mock
 from azrael.aztypes import RetVal
 
@@ -52,6 +53,7 @@ class TestUnitEventStore:
         es = eventstore.EventStore(topics=['#'])
         assert es.rmq is None
         assert m_setupRabbitMQ.call_count == 0
+        assert not es.waitForConnection(timeout=0).ok
 
         # If the 'rmq' is not None then setupRabbitMQ must not be called.
         es.rmq = {'x': 'y'}
@@ -69,6 +71,7 @@ class TestUnitEventStore:
         assert es.connect() == (True, None, None)
         assert m_setupRabbitMQ.call_count == 1
         assert es.rmq == {'foo': 'bar'}
+        assert es.waitForConnection(timeout=0).ok
 
     @mock.patch.object(eventstore.EventStore, 'setupRabbitMQ')
     def test_connect_when_setupRabbitMQ_raises_exception(self, m_setupRabbitMQ):
@@ -109,6 +112,31 @@ class TestUnitEventStore:
         m_chan.close.call_count == 1
         m_conn.close.call_count == 1
         assert es.rmq is None
+        assert not es.waitForConnection(timeout=0).ok
+
+    def test_waitForMessages(self):
+        """
+        'waitForMessages' must return as soon as enough messages have arrived
+        and return an error if they do not arrive before the timeout.
+        """
+        # Get an EventStore instance.
+        es = eventstore.EventStore(topics=['#'])
+
+        # No messages are cached, which is why the call must time out.
+        assert not es.waitForMessages(1, timeout=0.1).ok
+
+        # Inject a message from another thread (this is what Pika would do).
+        # 'waitForMessages' must return once it arrived.
+        method = MagicMock()
+        method.routing_key = 'foo'
+        args = (None, method, None, b'bar')
+        threading.Timer(0.1, es._onMessage, args=args).start()
+        assert es.waitForMessages(1, timeout=5) == (True, None, None)
+        assert es.getMessages() == (True, None, [('foo', b'bar')])
+
+        # Messages already in the cache must not block at all.
+        es._onMessage(*args)
+        assert es.waitForMessages(1, timeout=0).ok
 
     @mock.patch.object(eventstore.EventStore, '_blockingConsumePika')
     def test_blockingConsume_not_yet_connected(self, m__blockingConsumePika):
@@ -267,15 +295,13 @@ class TestIntegrationEventStore:
         established a connection to RabbitMQ.
         """
         # Spawn the threads.
-        es = [eventstore.EventStore(topics=topics) for _ in range(3)]
+        es = [eventstore.EventStore(topics=topics) for _ in range(num_clients)]
         [_.start() for _ in es]
 
-        # Wait until each thread updated its 'rmq' attribute.
-        while True:
-            if len([_.rmq for _ in es if _.rmq is None]) == 0:
-                return es
-            time.sleep(0.5)
-            print('waiting')
+        # Wait until each thread has connected.
+        for thread in es:
+            assert thread.waitForConnection(timeout=5).ok
+        return es
 
     def test_shutdown(self):
         """
@@ -323,11 +349,7 @@ class TestIntegrationEventStore:
 
         # Wait until the client received at least two messages (RabbitMQ incurs
         # some latency).
-        for ii in range(10):
-            time.sleep(0.1)
-            if len(es.messages) >= 2:
-                break
-            assert ii < 9
+        assert es.waitForMessages(2, timeout=1.0).ok
 
         # Verify we got both messages.
         ret = es.getMessages()
@@ -368,11 +390,7 @@ class TestIntegrationEventStore:
 
         # Wait until the client received at least two messages (RabbitMQ incurs
         # some latency).
-        for ii in range(10):
-            time.sleep(0.1)
-            if len(es.messages) >= 2:
-                break
-            assert ii < 9
+        assert es.waitForMessages(2, timeout=1.0).ok
 
         # Verify that we got the two messages for our topic.
         ret = es.getMessages()
@@ -404,11 +422,8 @@ class TestIntegrationEventStore:
 
         # Wait until each client received at least two messages (RabbitMQ incurs
         # some latency).
-        for ii in range(10):
-            time.sleep(0.1)
-            if min([len(_.messages) for _ in es]) >= 2:
-                break
-            assert ii < 9
+        for thread in es:
+            assert thread.waitForMessages(2, timeout=1.0).ok
 
         # Verify each client got both messages.
         for thread in es:
@@ -441,11 +456,7 @@ class TestIntegrationEventStore:
 
         # Wait until the client received at least two messages (RabbitMQ incurs
         # some latency).
-        for ii in range(10):
-            time.sleep(0.1)
-            if len(es.messages) >= 2:
-                break
-            assert ii < 9
+        assert es.waitForMessages(2, timeout=1.0).ok
 
         # Verify we got the message published for 'foo' and 'bar'.
         ret = es.getMessages()
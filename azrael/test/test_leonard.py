@@ -13,7 +13,6 @@ import unittest.mock as mock
 import azrael.leo_api as leoAPI
 
 from azrael.aztypes import RetVal
-from IPython import embed as ipshell
 from azrael.test.test import getCSBox, getCSSphere, getCSEmpty
 from azrael.test.test import getP2P, getLeonard, getRigidBody
 
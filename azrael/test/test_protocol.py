@@ -21,7 +21,6 @@ import azrael.test.test
 import azrael.aztypes as aztypes
 import azrael.protocol as protocol
 
-from IPython import embed as ipshell
 from azrael.test.test import getP2P, get6DofSpring2
 from azrael.test.test import getFragRaw, getFragDae, getRigidBody
 
@@ -101,6 +100,30 @@ class TestClerk:
         # The decoded template must match the original.
         assert dec['templates'] == payload_src
 
+    def test_addTemplate_nonascii(self):
+        """
+        The Base64 decoder must ignore non-ASCII characters in the encoded
+        files instead of raising an error.
+        """
+        # Compile a valid Template and Base64 encode all its files.
+        payload_src = self.getTestTemplate('t1')
+        payload = payload_src._asdict()
+        for fragname in payload['fragments']:
+            files = payload['fragments'][fragname]['files']
+            files = {k: base64.b64encode(v).decode('utf8') + '\u00e4'
+                     for k, v in files.items()}
+            payload['fragments'][fragname]['files'] = files
+
+        # The decoded template must match the original.
+        dec = protocol.ToClerk_AddTemplates_Decode({'templates': [payload]})
+        assert dec['templates'] == [payload_src]
+
+        # Same for the SetFragments codec.
+        enc = base64.b64encode(b'foo').decode('utf8') + '\u00e4'
+        payload = {'fragupdates': {'1': {'f': {'put': {'a': enc}}}}}
+        dec = protocol.ToClerk_SetFragments_Decode(payload)
+        assert dec['fragupdates']['1']['f']['put'] == {'a': b'foo'}
+
     def test_GetTemplate(self):
         """
         Verify the return format.
@@ -241,14 +241,10 @@ class TestLeonardAPI:
         # Create the data set for an `vecDim` vector field. For instance, an EM
         # field is a 3D vector field (ie vecDim=3), ie every position (x,y,z) has
         # an associated (E_x, E_y, E_z) vector.
-        data = np.zeros(dataDim, np.float64)
-        val = 0
-        for x in range(regionDim[0]):
-            for y in range(regionDim[1]):
-                for z in range(regionDim[2]):
-                    data[x, y, z, :] = [val, val + 1, val + 2]
-                    val += 3
-        del val, x, y, z
+        # The values simply enumerate all grid components in C-order, ie
+        # data[x, y, z, :] = [val, val + 1, val + 2] where `val` increases by
+        # three for every grid point.
+        data = np.arange(np.prod(dataDim), dtype=np.float64).reshape(dataDim)
 
         # Apply the data set.
         ret = vg.setRegion(name, ofs, data)
@@ -258,17 +254,20 @@ class TestLeonardAPI:
         ret = vg.getRegion(name, ofs, regionDim)
         assert np.array_equal(ret.data, data)
 
+        # Query all points at once with 'getValues'. The grid positions are
+        # in the same (C-) order as the flattened data set.
+        idx = np.indices(regionDim).reshape(3, -1).T
+        ret = vg.getValues(name, list(ofs + idx))
+        assert ret.ok
+        assert np.array_equal(ret.data, data.reshape(-1, vecDim))
+        del idx
+
         # Query all points individually.
         for x in range(regionDim[0]):
             for y in range(regionDim[1]):
                 for z in range(regionDim[2]):
                     pos = ofs + np.array([x, y, z], np.float64)
 
-                    # Query one value with 'getValue'.
-                    ret = vg.getValues(name, [pos])
-                    assert ret.ok
-                    assert np.array_equal(ret.data, [data[x, y, z]])
-
                     # Query one value with 'getRegion'.
                     ret = vg.getRegion(name, np.array(pos), (1, 1, 1))
                     assert ret.ok
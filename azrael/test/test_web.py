@@ -1,40 +1,45 @@
 import json
 import pytest
+import tornado.gen
 import tornado.web
 import tornado.testing
 import azrael.web
 import azrael.clerk
 import azrael.config as config
 
-from IPython import embed as ipshell
 from azrael.test.test import getFragRaw, getFragDae, getTemplate
 from azrael.test.test import getCSBox, getCSSphere, getRigidBody
 
 
 class TestWebServer(tornado.testing.AsyncHTTPTestCase):
     @classmethod
-    def setup_class(cls):
-        pass
+    def setUpClass(cls):
+        # Dibbler instance is necessary because this test suite contains
+        # several integration tests between Dibbler and WebServer. All tests
+        # (and all request handlers) share the same instance.
+        cls.dibbler = azrael.dibbler.Dibbler()
+
+        # Clerk keeps no state of its own between calls. All tests can
+        # therefore use the same instance.
+        cls.clerk = azrael.clerk.Clerk()
 
     @classmethod
-    def teardown_class(cls):
-        pass
+    def tearDownClass(cls):
+        del cls.dibbler, cls.clerk
 
-    def setup_method(self, method):
-        pass
+    def setUp(self):
+        super().setUp()
 
-    def teardown_method(self, method):
-        pass
+        # Every test starts with empty databases.
+        self.dibbler.reset()
+        azrael.datastore.init(flush=True)
 
     def get_app(self):
-        # Dibbler instance is necessary because this test suite contains
-        # several integration tests between Dibbler and WebServer.
-        self.dibbler = azrael.dibbler.Dibbler()
-
         # Handler to serve up models.
         FH = azrael.web.MyGridFSHandler
-        handlers = [(config.url_templates + '/(.*)', FH),
-                    (config.url_instances + '/(.*)', FH)]
+        kwargs = {'dibbler': self.dibbler}
+        handlers = [(config.url_templates + '/(.*)', FH, kwargs),
+                    (config.url_instances + '/(.*)', FH, kwargs)]
         return tornado.web.Application(handlers)
 
     def downloadFragments(self, url: str, fnames: list):
@@ -50,11 +55,15 @@ class TestWebServer(tornado.testing.AsyncHTTPTestCase):
         :rtype: FragDae
         :raises: AssertionError if there was a problem.
         """
-        # Download all the textures.
-        fdata = {}
-        for fname in fnames:
-            fdata[fname] = self.fetch(url + fname, method='GET').body
-        return fdata
+        # Download all files concurrently.
+        def fetchAll():
+            return tornado.gen.multi([
+                self.http_client.fetch(self.get_url(url + fname),
+                                       raise_error=False)
+                for fname in fnames
+            ])
+        ret = self.io_loop.run_sync(fetchAll)
+        return {fname: resp.body for fname, resp in zip(fnames, ret)}
 
     def verifyTemplate(self, url, fragments):
         """
@@ -68,19 +77,18 @@ class TestWebServer(tornado.testing.AsyncHTTPTestCase):
         :raises: AssertionError if not all fragments in ``fragments`` match
                  those available at ``url``.
         """
-        # Download- and verify each fragment.
+        # Compile the files of all fragments and their expected content.
+        # Raw fragments have only a 'model.json' file whereas Collada
+        # fragments also contain textures.
+        ref = {}
         for aid, frag in fragments.items():
-            ftype = frag.fragtype.upper()
-            if ftype == 'RAW':
-                tmp_url = url + '/{name}/'.format(name=aid)
-                assert self.downloadFragments(tmp_url, ['model.json']) == frag.files
-            elif ftype == 'DAE':
-                tmp_url = url + '/{name}/'.format(name=aid)
-                fnames = list(frag.files.keys())
-                ret = self.downloadFragments(tmp_url, fnames)
-                assert ret == frag.files
-            else:
-                assert False
+            assert frag.fragtype.upper() in ('RAW', 'DAE')
+            for fname, fdata in frag.files.items():
+                ref[aid + '/' + fname] = fdata
+
+        # Download the files of all fragments in a single batch and verify
+        # their content.
+        assert self.downloadFragments(url + '/', list(ref.keys())) == ref
 
     def test_invalid_file_name(self):
         """
@@ -99,9 +107,7 @@ class TestWebServer(tornado.testing.AsyncHTTPTestCase):
         """
         Add and query a template with one Raw fragment.
         """
-        self.dibbler.reset()
-        azrael.datastore.init(flush=True)
-        clerk = azrael.clerk.Clerk()
+        clerk = self.clerk
 
         # Create two Templates. The first has only one Raw- and two
         # Collada geometries, the other has it the other way around.
@@ -124,23 +130,18 @@ class TestWebServer(tornado.testing.AsyncHTTPTestCase):
         # anything.
         assert clerk.addTemplates([t1]) == (True, None, {'t1': False})
 
-        # Verify the first template is available for download via WebServer.
-        url_template = config.url_templates
-        self.verifyTemplate('{}/t1'.format(url_template), t1.fragments)
-
         # Add the second template and verify both are available for download
-        # via WebServer.
+        # via WebServer (the first template has not changed since it was
+        # added, so there is no need to download it twice).
         assert clerk.addTemplates([t2]).ok
-        self.verifyTemplate('{}/t1'.format(url_template), t1.fragments)
-        self.verifyTemplate('{}/t2'.format(url_template), t2.fragments)
+        self.verifyTemplate(config.url_templates + '/t1', t1.fragments)
+        self.verifyTemplate(config.url_templates + '/t2', t2.fragments)
 
     def test_spawnTemplates(self):
         """
         Spawn a template and verify it is available via WebServer.
         """
-        self.dibbler.reset()
-        azrael.datastore.init(flush=True)
-        clerk = azrael.clerk.Clerk()
+        clerk = self.clerk
 
         # # Create two Templates. The first has only one Raw- and two
         # # Collada geometries, the other has it the other way around.
@@ -158,34 +159,33 @@ class TestWebServer(tornado.testing.AsyncHTTPTestCase):
 
         # Add both templates and verify they are available.
         assert clerk.addTemplates([t1, t2]).ok
-        self.verifyTemplate('{}/t1'.format(config.url_templates), t1.fragments)
-        self.verifyTemplate('{}/t2'.format(config.url_templates), t2.fragments)
+        self.verifyTemplate(config.url_templates + '/t1', t1.fragments)
+        self.verifyTemplate(config.url_templates + '/t2', t2.fragments)
 
         # No object instance with ID=1 must exist yet.
         url_inst = config.url_instances
+        url_inst1 = url_inst + '/1'
         with pytest.raises(AssertionError):
-            self.verifyTemplate('{}/{}'.format(url_inst, 1), t1.fragments)
+            self.verifyTemplate(url_inst1, t1.fragments)
 
         # Spawn the first template (it must get objID=1).
         ret = clerk.spawn([{'templateID': 't1', 'rbs': {'imass': 1}}])
         assert ret.data == ['1']
-        self.verifyTemplate('{}/{}'.format(url_inst, 1), t1.fragments)
+        self.verifyTemplate(url_inst1, t1.fragments)
 
         # Spawn two more templates and very their instance models.
         new_objs = [{'templateID': 't2', 'rbs': {'imass': 1}},
                     {'templateID': 't1', 'rbs': {'imass': 1}}]
         ret = clerk.spawn(new_objs)
         assert ret.data == ['2', '3']
-        self.verifyTemplate('{}/{}'.format(url_inst, 2), t2.fragments)
-        self.verifyTemplate('{}/{}'.format(url_inst, 3), t1.fragments)
+        self.verifyTemplate(url_inst + '/2', t2.fragments)
+        self.verifyTemplate(url_inst + '/3', t1.fragments)
 
     def test_deleteInstance(self):
         """
         Add/remove an instance from Dibbler via Clerk and verify via WebServer.
         """
-        self.dibbler.reset()
-        azrael.datastore.init(flush=True)
-        clerk = azrael.clerk.Clerk()
+        clerk = self.clerk
 
         # Create a Template.
         frags = {'name1': getFragRaw()}
@@ -193,17 +193,17 @@ class TestWebServer(tornado.testing.AsyncHTTPTestCase):
 
         # Add-, spawn-, and verify the template.
         assert clerk.addTemplates([t1]).ok
-        self.verifyTemplate('{}/t1'.format(config.url_templates), t1.fragments)
+        self.verifyTemplate(config.url_templates + '/t1', t1.fragments)
         ret = clerk.spawn([{'templateID': 't1', 'rbs': {'imass': 1}}])
         assert ret.data == ['1']
 
         # Verify that the instance exists.
-        url_inst = config.url_instances
-        self.verifyTemplate('{}/{}'.format(url_inst, 1), frags)
+        url_inst1 = config.url_instances + '/1'
+        self.verifyTemplate(url_inst1, frags)
 
         # Delete the instance and verify it is now gone.
         cnt = self.dibbler.getNumFiles().data
         assert clerk.removeObjects(['1']) == (True, None, None)
         self.dibbler.getNumFiles().data == cnt - 2
         with pytest.raises(AssertionError):
-            self.verifyTemplate('{}/{}'.format(url_inst, 1), frags)
+            self.verifyTemplate(url_inst1, frags)
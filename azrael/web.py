@@ -69,6 +69,10 @@ class WebsocketHandler(tornado.websocket.WebSocketHandler):
         This method is a Tornado callback and triggers when a client initiates
         a new Websocket connection.
         """
+        # Send replies immediately instead of buffering them (Nagle). They are
+        # usually small and the client blocks until it receives them.
+        self.set_nodelay(True)
+
         # Create ZeroMQ sockets and connect them to Clerk.
         addr = 'tcp://{}:{}'.format(*config.azService['clerk'])
         self.ctx = zmq.Context()
@@ -139,9 +143,11 @@ class WebsocketHandler(tornado.websocket.WebSocketHandler):
             except (ValueError, TypeError):
                 ret = RetVal(False, 'JSON decoding error in Client', None)
 
-            # Return payload (or error message) to client.
+            # Return payload (or error message) to client. Clerk already
+            # encoded a successful reply as JSON so relay it verbatim instead
+            # of encoding the same data a second time.
             if ret.ok:
-                self.returnToClient(ret)
+                self.write_message(payload, binary=False)
             else:
                 self.returnToClient(RetVal(False, ret.msg, None))
 
@@ -176,12 +182,20 @@ class MyGridFSHandler(tornado.web.RequestHandler):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.dibbler = azrael.dibbler.Dibbler()
-
         # Create a Class-specific logger.
         name = '.'.join([__name__, self.__class__.__name__])
         self.logit = logging.getLogger(name)
 
+    def initialize(self, dibbler):
+        """
+        Tornado creates a new handler for every request. To avoid a new
+        database connection per request all handlers share the same
+        ``dibbler`` instance.
+
+        :param Dibbler dibbler: Dibbler instance to serve files from.
+        """
+        self.dibbler = dibbler
+
     def set_extra_headers(self, path):
         """
         Disable all caches (maybe). For more information see
@@ -277,11 +291,13 @@ class WebServer(config.AzraelProcess):
             ('/static/(.*)', MyStaticFileHandler, {'path': dirname})
         )
 
-        # Serve up template- and instance models.
+        # Serve up template- and instance models. All handlers share the same
+        # Dibbler instance.
+        gridfs_kwargs = {'dibbler': azrael.dibbler.Dibbler()}
         handlers.append(
-            (config.url_templates + '/(.*)', MyGridFSHandler))
+            (config.url_templates + '/(.*)', MyGridFSHandler, gridfs_kwargs))
         handlers.append(
-            (config.url_instances + '/(.*)', MyGridFSHandler))
+            (config.url_instances + '/(.*)', MyGridFSHandler, gridfs_kwargs))
 
         # Proxy handler to arbitrate between Websockets and WebServer.
         handlers.append(('/websocket', WebsocketHandler))
@@ -19,6 +19,7 @@ import os
 import sys
 import time
 import json
+import zipfile
 import subprocess
 
 # Import 'setproctitle' *before* NumPy, even though it is not even used in this
@@ -38,7 +39,6 @@ del p
 import model_import
 import azutils
 import azrael.aztypes as aztypes
-from IPython import embed as ipshell
 from azrael.aztypes import Template, FragMeta
 from azrael.aztypes import CollShapeMeta, CollShapeEmpty, CollShapeSphere
 from azrael.aztypes import CollShapeBox
@@ -126,82 +126,133 @@ def getRigidBody(scale: (int, float)=1,
         linFactor, rotFactor, version)
 
 
-def loadBoosterCubeBlender():
-    """
-    Load the Spaceship (if you want to call it that) from "boostercube.dae".
+# Bump this whenever `_buildBoosterCubeMesh` changes to invalidate meshes
+# cached by earlier versions.
+_BOOSTERCUBE_CACHE_VERSION = 1
 
-    This function is custom made for the Blender model of the cube with
-    boosters because the model file is broken (no idea if the fault is with me,
-    Blender, or the AssImp library).
 
-    In particular, the ``loadModel`` function will only return the vertices for
-    the body (cube) and *one* thruster (instead of six). To remedy, this
-    function will attach a copy of that thruster to each side of the cube.  It
-    will manually assign the colors too.
+def _buildBoosterCubeMesh(fname):
     """
+    Return the vertices of the booster cube in ``fname`` and the number of
+    vertices per thruster.
 
-    # Load the Collada model.
-    p = os.path.dirname(os.path.abspath(__file__))
-    fname = os.path.join(p, 'models', 'boostercube', 'boostercube.dae')
+    This is a helper for ``loadBoosterCubeBlender``.
+    """
     vert, uv, rgb = loadModel(fname)
     del uv, rgb
 
     # Extract the body and thruster component.
-    body, thruster_z = np.array(vert[0]), np.array(vert[1])
+    body = np.array(vert[0], np.float64)
+    thruster_z = np.array(vert[1], np.float64)
 
     # The body should be a unit cube, but I do not know what Blender created
     # exactly. Therefore, determine the average position values (which should
     # all have the same value except for the sign).
     body_scale = np.mean(np.abs(body))
 
-    # Reduce the thruster size, translate it to the cube's surface, and
-    # duplicate on -z axis.
-    thruster_z = 0.3 * np.reshape(thruster_z, (len(thruster_z) // 3, 3))
-    thruster_z += [0, 0, -.6]
-    thruster_z = thruster_z.flatten()
-    thruster_z = np.hstack((thruster_z, -thruster_z))
+    # Reduce the thruster size and translate it to the cube's surface.
+    thruster = 0.3 * np.reshape(thruster_z, (len(thruster_z) // 3, 3))
+    thruster += [0, 0, -.6]
+    num_thruster = len(thruster)
+
+    # Allocate the vertices for the three thruster pairs (each an N x 3
+    # matrix) and the body in one array, then fill it in place. The vertices
+    # remain 64 bit floats because they end up in the JSON geometry for Clerk.
+    vert = np.empty(6 * thruster.size + body.size, np.float64)
+    thrusters = vert[:6 * thruster.size].reshape(3, 2 * num_thruster, 3)
 
-    # Reshape the vertices into an N x 3 matrix and duplicate for the other
-    # four thrusters.
-    thruster_z = np.reshape(thruster_z, (len(thruster_z) // 3, 3))
-    thruster_x, thruster_y = np.array(thruster_z), np.array(thruster_z)
+    # Duplicate the thruster on the -z axis.
+    thrusters[0, :num_thruster] = thruster
+    np.negative(thruster, out=thrusters[0, num_thruster:])
 
     # We will compute the thrusters for the remaining two cube faces with a
-    # 90degree rotation around the x- and y axis.
+    # 90degree rotation around the x- and y axis. Rotate all vertices at once
+    # with the respective rotation matrix (`toMatrix` returns 32 bit floats).
     s2 = 1 / np.sqrt(2)
-    quat_x = azutils.Quaternion(s2, 0, 0, s2)
-    quat_y = azutils.Quaternion(0, s2, 0, s2)
-    for ii, (tx, ty) in enumerate(zip(thruster_x, thruster_y)):
-        thruster_x[ii] = quat_x * tx
-        thruster_y[ii] = quat_y * ty
-
-    # Flatten the arrays.
-    thruster_z = thruster_z.flatten()
-    thruster_x = thruster_x.flatten()
-    thruster_y = thruster_y.flatten()
-
-    # Combine all thrusters and the body into a single triangle mesh. Then
-    # scale the entire mesh to ensure the cube part is indeed a unit cube.
-    vert = np.hstack((thruster_z, thruster_x, thruster_y, body))
+    rot_x = azutils.Quaternion(s2, 0, 0, s2).toMatrix()[:3, :3]
+    rot_y = azutils.Quaternion(0, s2, 0, s2).toMatrix()[:3, :3]
+    rot_x, rot_y = rot_x.astype(np.float64), rot_y.astype(np.float64)
+    np.dot(thrusters[0], rot_x.T, out=thrusters[1])
+    np.dot(thrusters[0], rot_y.T, out=thrusters[2])
+    del thruster, thrusters
+
+    # Add the body to complete the triangle mesh. Then scale the entire mesh
+    # to ensure the cube part is indeed a unit cube.
+    vert[6 * thruster_z.size:] = body
     vert /= body_scale
+    return vert, num_thruster
 
-    # Assign the same base color to all three thrusters.
-    rgb_thruster = np.tile([0.8, 0, 0], len(thruster_x) // 3)
-    rgb_thrusters = np.tile(rgb_thruster, 3)
 
-    # Assign a color to the body.
-    rgb_body = np.tile([0.8, 0.8, 0.8], len(body) // 3)
+def loadBoosterCubeBlender():
+    """
+    Load the Spaceship (if you want to call it that) from "boostercube.dae".
 
-    # Flatten the RGB vectors to match the vertex vector.
-    rgb = np.hstack((rgb_thrusters, rgb_body))
-    del rgb_thruster, rgb_thrusters, rgb_body
+    This function is custom made for the Blender model of the cube with
+    boosters because the model file is broken (no idea if the fault is with me,
+    Blender, or the AssImp library).
+
+    In particular, the ``loadModel`` function will only return the vertices for
+    the body (cube) and *one* thruster (instead of six). To remedy, this
+    function will attach a copy of that thruster to each side of the cube.  It
+    will manually assign the colors too.
+
+    The vertices are cached in "~/.cache/azrael/boostercube.npz" and re-used
+    as long as neither the modification time of the Collada file nor
+    ``_BOOSTERCUBE_CACHE_VERSION`` changes. The colors are not cached because
+    they contain random noise.
+    """
 
-    # Add some "noise" to the blueish flame color.
-    rgb += 0.2 * (np.random.rand(len(rgb)) - 0.5)
+    # Load the Collada model.
+    p = os.path.dirname(os.path.abspath(__file__))
+    fname = os.path.join(p, 'models', 'boostercube', 'boostercube.dae')
+
+    # Use the cached mesh unless the Collada file, or the code that processes
+    # it, has changed since.
+    cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'azrael')
+    cache_path = os.path.join(cache_dir, 'boostercube.npz')
+    mtime = os.path.getmtime(fname)
+    vert = None
+    try:
+        with np.load(cache_path) as cache:
+            if (cache['version'] == _BOOSTERCUBE_CACHE_VERSION and
+                    cache['mtime'] == mtime):
+                vert = cache['vert']
+                num_thruster = int(cache['num_thruster'])
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        pass
+
+    if vert is None:
+        vert, num_thruster = _buildBoosterCubeMesh(fname)
+
+        # Cache the mesh for the next call. This is merely an optimisation
+        # and must not stop the demo if the cache directory is not writable.
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            np.savez(cache_path, version=_BOOSTERCUBE_CACHE_VERSION,
+                     mtime=mtime, vert=vert, num_thruster=num_thruster)
+        except OSError:
+            pass
+
+    # Assign the same base color to all three thrusters and another one to
+    # the body.
+    rgb = np.empty(len(vert), np.float32)
+    rgb_triplets = rgb.reshape(len(rgb) // 3, 3)
+    rgb_triplets[:6 * num_thruster] = [0.8, 0, 0]
+    rgb_triplets[6 * num_thruster:] = [0.8, 0.8, 0.8]
+    del rgb_triplets
+
+    # Add some "noise" to the blueish flame color. All operations are
+    # in-place to avoid allocating a new temporary array at every step.
+    noise = np.random.rand(len(rgb)).astype(np.float32)
+    noise -= 0.5
+    noise *= 0.2
+    rgb += noise
+    del noise
 
     # Scale the RGB values from [0, 1] to a [0, 255] integers.
-    rgb = rgb.clip(0, 1)
-    rgb = np.array(rgb * 255, np.uint8)
+    np.clip(rgb, 0, 1, out=rgb)
+    rgb *= 255
+    rgb = rgb.astype(np.uint8)
 
     # Return the model data (it has no UV data).
     uv = []
@@ -241,7 +292,7 @@ def loadModel(fname):
     # The model may contain several sub-models. Each one has a set of vertices,
     # UV- and texture maps. The following code simply flattens the three lists
     # of lists into just three lists.
-    vert = np.array(mesh['vertices']).flatten()
+    vert = np.array(mesh['vertices']).ravel()
     uv = np.array(mesh['UV'])
     rgb = np.array(mesh['RGB'])
     print('done')
@@ -249,6 +300,23 @@ def loadModel(fname):
     return vert, uv, rgb
 
 
+# Vertices of a cube with unit half lengths (one vertex per row).
+_CUBE_VERT = np.array([
+    -1.0, -1.0, -1.0,   -1.0, -1.0, +1.0,   -1.0, +1.0, +1.0,
+    -1.0, -1.0, -1.0,   -1.0, +1.0, +1.0,   -1.0, +1.0, -1.0,
+    +1.0, -1.0, -1.0,   +1.0, +1.0, +1.0,   +1.0, -1.0, +1.0,
+    +1.0, -1.0, -1.0,   +1.0, +1.0, -1.0,   +1.0, +1.0, +1.0,
+    +1.0, -1.0, +1.0,   -1.0, -1.0, -1.0,   +1.0, -1.0, -1.0,
+    +1.0, -1.0, +1.0,   -1.0, -1.0, +1.0,   -1.0, -1.0, -1.0,
+    +1.0, +1.0, +1.0,   +1.0, +1.0, -1.0,   -1.0, +1.0, -1.0,
+    +1.0, +1.0, +1.0,   -1.0, +1.0, -1.0,   -1.0, +1.0, +1.0,
+    +1.0, +1.0, -1.0,   -1.0, -1.0, -1.0,   -1.0, +1.0, -1.0,
+    +1.0, +1.0, -1.0,   +1.0, -1.0, -1.0,   -1.0, -1.0, -1.0,
+    -1.0, +1.0, +1.0,   -1.0, -1.0, +1.0,   +1.0, -1.0, +1.0,
+    +1.0, +1.0, +1.0,   -1.0, +1.0, +1.0,   +1.0, -1.0, +1.0
+]).reshape(-1, 3)
+
+
 def cubeGeometry(hlen_x=1.0, hlen_y=1.0, hlen_z=1.0):
     """
     Return the vertices and collision shape for a Box.
@@ -256,26 +324,8 @@ def cubeGeometry(hlen_x=1.0, hlen_y=1.0, hlen_z=1.0):
     The parameters ``hlen_*`` are the half lengths of the box in the respective
     dimension.
     """
-    # Vertices that define a Cube.
-    vert = 1 * np.array([
-        -1.0, -1.0, -1.0,   -1.0, -1.0, +1.0,   -1.0, +1.0, +1.0,
-        -1.0, -1.0, -1.0,   -1.0, +1.0, +1.0,   -1.0, +1.0, -1.0,
-        +1.0, -1.0, -1.0,   +1.0, +1.0, +1.0,   +1.0, -1.0, +1.0,
-        +1.0, -1.0, -1.0,   +1.0, +1.0, -1.0,   +1.0, +1.0, +1.0,
-        +1.0, -1.0, +1.0,   -1.0, -1.0, -1.0,   +1.0, -1.0, -1.0,
-        +1.0, -1.0, +1.0,   -1.0, -1.0, +1.0,   -1.0, -1.0, -1.0,
-        +1.0, +1.0, +1.0,   +1.0, +1.0, -1.0,   -1.0, +1.0, -1.0,
-        +1.0, +1.0, +1.0,   -1.0, +1.0, -1.0,   -1.0, +1.0, +1.0,
-        +1.0, +1.0, -1.0,   -1.0, -1.0, -1.0,   -1.0, +1.0, -1.0,
-        +1.0, +1.0, -1.0,   +1.0, -1.0, -1.0,   -1.0, -1.0, -1.0,
-        -1.0, +1.0, +1.0,   -1.0, -1.0, +1.0,   +1.0, -1.0, +1.0,
-        +1.0, +1.0, +1.0,   -1.0, +1.0, +1.0,   +1.0, -1.0, +1.0
-    ])
-
-    # Scale the x/y/z dimensions.
-    vert[0::3] *= hlen_x
-    vert[1::3] *= hlen_y
-    vert[2::3] *= hlen_z
+    # Scale the x/y/z dimensions of the unit cube.
+    vert = (_CUBE_VERT * (hlen_x, hlen_y, hlen_z)).flatten()
 
     # Convenience.
     box = CollShapeBox(hlen_x, hlen_y, hlen_z)
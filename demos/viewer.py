@@ -26,11 +26,13 @@ install them with the following commands:
 """
 
 # Add the viewer directory to the Python path.
+import io
 import os
+import math
 import sys
 import time
 import json
-import PIL
+import PIL.Image
 import demolib
 import tempfile
 import argparse
@@ -122,35 +124,66 @@ def perspective(fov, ar, near, far):
     * ``near``: near clipping plane
     * ``far``: far clipping plane
     """
-    fov = 1 / np.tan(fov / 2)
-    mat = np.zeros((4, 4))
+    fov = 1 / math.tan(fov / 2)
+    mat = np.zeros((4, 4), np.float32)
     mat[0, 0] = fov / ar
     mat[1, 1] = fov
     mat[2, 2] = (far + near) / (far - near)
     mat[2, 3] = -2 * far * near / (far - near)
     mat[3, 2] = 1
-    return mat.astype(np.float32)
+    return mat
+
+
+def modelMatrices(scale, position, rotation):
+    """
+    Return the model matrices of N objects as an N x 4 x 4 array.
+
+    * ``scale``: N scale factors
+    * ``position``: N x 3 positions
+    * ``rotation``: N x 4 Quaternions (x, y, z, w)
+    """
+    # Shorthands.
+    x, y, z, w = np.reshape(np.array(rotation, np.float64), (-1, 4)).T
+    scale = np.array(scale, np.float64)
+
+    # Rotation matrices (same formula as in Quaternion.toMatrix).
+    mat = np.zeros((len(scale), 4, 4), np.float32)
+    mat[:, 0, 0] = 1 - 2 * y * y - 2 * z * z
+    mat[:, 0, 1] = 2 * x * y - 2 * z * w
+    mat[:, 0, 2] = 2 * x * z + 2 * y * w
+    mat[:, 1, 0] = 2 * x * y + 2 * z * w
+    mat[:, 1, 1] = 1 - 2 * x * x - 2 * z * z
+    mat[:, 1, 2] = 2 * y * z - 2 * x * w
+    mat[:, 2, 0] = 2 * x * z - 2 * y * w
+    mat[:, 2, 1] = 2 * y * z + 2 * x * w
+    mat[:, 2, 2] = 1 - 2 * x * x - 2 * y * y
+
+    # Scale the rotation matrices and add the translation.
+    mat[:, :3, :3] *= scale[:, None, None]
+    mat[:, :3, 3] = np.reshape(position, (-1, 3))
+    mat[:, 3, 3] = 1
+    return mat
+
+
+# Vertices of a cube with side length 1 (one vertex per row).
+_CUBE_VERT = 0.5 * np.array([
+    -1.0, -1.0, -1.0,   -1.0, -1.0, +1.0,   -1.0, +1.0, +1.0,
+    +1.0, +1.0, -1.0,   -1.0, -1.0, -1.0,   -1.0, +1.0, -1.0,
+    +1.0, -1.0, +1.0,   -1.0, -1.0, -1.0,   +1.0, -1.0, -1.0,
+    +1.0, +1.0, -1.0,   +1.0, -1.0, -1.0,   -1.0, -1.0, -1.0,
+    -1.0, -1.0, -1.0,   -1.0, +1.0, +1.0,   -1.0, +1.0, -1.0,
+    +1.0, -1.0, +1.0,   -1.0, -1.0, +1.0,   -1.0, -1.0, -1.0,
+    -1.0, +1.0, +1.0,   -1.0, -1.0, +1.0,   +1.0, -1.0, +1.0,
+    +1.0, +1.0, +1.0,   +1.0, -1.0, -1.0,   +1.0, +1.0, -1.0,
+    +1.0, -1.0, -1.0,   +1.0, +1.0, +1.0,   +1.0, -1.0, +1.0,
+    +1.0, +1.0, +1.0,   +1.0, +1.0, -1.0,   -1.0, +1.0, -1.0,
+    +1.0, +1.0, +1.0,   -1.0, +1.0, -1.0,   -1.0, +1.0, +1.0,
+    +1.0, +1.0, +1.0,   -1.0, +1.0, +1.0,   +1.0, -1.0, +1.0
+]).reshape(-1, 3)
 
 
 def getGeometriesCube(pos=np.zeros(3)):
-    buf_vert = 0.5 * np.array([
-        -1.0, -1.0, -1.0,   -1.0, -1.0, +1.0,   -1.0, +1.0, +1.0,
-        +1.0, +1.0, -1.0,   -1.0, -1.0, -1.0,   -1.0, +1.0, -1.0,
-        +1.0, -1.0, +1.0,   -1.0, -1.0, -1.0,   +1.0, -1.0, -1.0,
-        +1.0, +1.0, -1.0,   +1.0, -1.0, -1.0,   -1.0, -1.0, -1.0,
-        -1.0, -1.0, -1.0,   -1.0, +1.0, +1.0,   -1.0, +1.0, -1.0,
-        +1.0, -1.0, +1.0,   -1.0, -1.0, +1.0,   -1.0, -1.0, -1.0,
-        -1.0, +1.0, +1.0,   -1.0, -1.0, +1.0,   +1.0, -1.0, +1.0,
-        +1.0, +1.0, +1.0,   +1.0, -1.0, -1.0,   +1.0, +1.0, -1.0,
-        +1.0, -1.0, -1.0,   +1.0, +1.0, +1.0,   +1.0, -1.0, +1.0,
-        +1.0, +1.0, +1.0,   +1.0, +1.0, -1.0,   -1.0, +1.0, -1.0,
-        +1.0, +1.0, +1.0,   -1.0, +1.0, -1.0,   -1.0, +1.0, +1.0,
-        +1.0, +1.0, +1.0,   -1.0, +1.0, +1.0,   +1.0, -1.0, +1.0])
-
-    N = 3
-    M = len(buf_vert) // N
-    buf_vert = np.reshape(buf_vert, (M, N)) + pos
-    return buf_vert.flatten()
+    return (_CUBE_VERT + pos).flatten()
 
 
 class ImageWriter(QtCore.QObject):
@@ -193,10 +226,15 @@ class ImageWriter(QtCore.QObject):
         if self.videoDir is None:
             return
 
-        # Build the file name and write the image.
+        # Build the file name and write the image. For PNG files Qt maps the
+        # quality setting to the zlib level ((100 - quality) * 9 / 91),
+        # ie. a quality of 80 selects level 1: the fastest level that still
+        # compresses. This keeps the Deflate step cheap enough to keep up
+        # with the frame rate. The frames are only intermediate files for the
+        # video anyway.
         fname = 'frame_{0:05d}.png'.format(self.imgCnt)
         fname = os.path.join(self.videoDir, fname)
-        img.save(fname)
+        img.save(fname, 'PNG', 80)
 
         # Increase the image counter.
         self.imgCnt += 1
@@ -251,17 +289,16 @@ class Camera:
         """
         Return the camera matrix.
         """
-        # Translation matrix.
-        trans = np.eye(4)
-        trans[:3, 3] = -self.position
-
-        # Rotation matrix to undo the camera rotation.
-        rot = np.zeros((4, 4))
-        rot[:3, :3] = np.vstack((self.right, self.up, self.view))
-        rot[3, 3] = 1
-
-        # Combine the matrices into one.
-        return np.dot(rot, trans)
+        # The camera matrix is the product of the rotation matrix that undoes
+        # the camera rotation, and the translation matrix that undoes the
+        # camera position. Fill its blocks directly instead of multiplying
+        # two 4x4 matrices.
+        mat = np.eye(4)
+        mat[0, :3] = self.right
+        mat[1, :3] = self.up
+        mat[2, :3] = self.view
+        mat[:3, 3] = -np.dot(mat[:3, :3], self.position)
+        return mat
 
     def rotate(self, left, up):
         """
@@ -273,19 +310,25 @@ class Camera:
         self.phi += left
         self.theta += up
 
+        # The angles are plain scalars; the 'math' functions are much cheaper
+        # for them than the NumPy ufuncs.
+        sin_phi, cos_phi = math.sin(self.phi), math.cos(self.phi)
+        sin_theta, cos_theta = math.sin(self.theta), math.cos(self.theta)
+
         # Compute the viewing direction (z-axis in camera space).
-        self.view[0] = np.sin(self.phi) * np.cos(self.theta)
-        self.view[1] = np.sin(self.theta)
-        self.view[2] = np.cos(self.theta) * np.cos(self.phi)
+        self.view[:] = (sin_phi * cos_theta, sin_theta, cos_theta * cos_phi)
 
         # Compute the left-vector (x-axis in camera space).
-        self.right[0] = -np.cos(self.phi)
-        self.right[1] = 0
-        self.right[2] = np.sin(self.phi)
+        self.right[:] = (-cos_phi, 0, sin_phi)
 
-        # Compute the up-vector (y-axis in camera space) from the previous two
-        # vectors.
-        self.up = -np.cross(self.view, self.right)
+        # Compute the up-vector (y-axis in camera space) as the negative cross
+        # product of the previous two vectors. The second component of the
+        # left-vector is always zero.
+        self.up[:] = (
+            -self.view[1] * sin_phi,
+            self.view[2] * cos_phi + self.view[0] * sin_phi,
+            -self.view[1] * cos_phi,
+        )
 
     def moveForward(self):
         """
@@ -327,6 +370,11 @@ class ViewerWidget(QtOpenGL.QGLWidget):
         # will always coincide with that of the camera.
         self.show_player = show_player
 
+        # Collision shape of the player object.
+        cs = CollShapeBox(1, 1, 1)
+        self.cs_player = CollShapeMeta('box', (0, 0, 0), (0, 0, 0, 1), cs)
+        del cs
+
         # Camera instance.
         self.camera = None
 
@@ -371,8 +419,10 @@ class ViewerWidget(QtOpenGL.QGLWidget):
         self.matPerspective = perspective(self.fov, self.aspect_ratio,
                                           self.near, self.far)
 
-        # The timer will re-start itself and trigger OpenGL updates.
+        # The timer triggers the OpenGL updates. Its first tick comes after a
+        # start-up delay; timerEvent then switches it to the frame interval.
         self.drawTimer = self.startTimer(500)
+        self.drawTimerInitial = True
 
         # Frame counter and frame timer.
         self.frameCnt = 0
@@ -401,9 +451,9 @@ class ViewerWidget(QtOpenGL.QGLWidget):
         if objID not in self.oldSVs:
             return False
 
-        cs_old = self.newSVs[objID]['rbs']['version']
-        cs_new = self.oldSVs[objID]['rbs']['version']
-        return (cs_old != cs_new)
+        version_old = self.oldSVs[objID]['rbs']['version']
+        version_new = self.newSVs[objID]['rbs']['version']
+        return (version_old != version_new)
 
     def upload2GPU(self, objID, fragID, frag):
         """
@@ -421,9 +471,10 @@ class ViewerWidget(QtOpenGL.QGLWidget):
         width, height = frag.width, frag.height
 
         # GPU needs float32 values for vertices and UV, and uint8 for RGB.
-        buf_vert = np.array(frag.vert).astype(np.float32)
-        buf_uv = np.array(frag.uv).astype(np.float32)
-        buf_rgb = np.array(frag.rgb).astype(np.uint8)
+        # Convert the data in a single step, and only if necessary.
+        buf_vert = np.ascontiguousarray(frag.vert, np.float32)
+        buf_uv = np.ascontiguousarray(frag.uv, np.float32)
+        buf_rgb = np.ascontiguousarray(frag.rgb, np.uint8)
 
         # Sanity checks.
         assert (len(buf_vert) % 9) == 0
@@ -465,17 +516,14 @@ class ViewerWidget(QtOpenGL.QGLWidget):
             if len(buf_rgb) == numVertices * 3:
                 # No UV map, but vertex colors. Add the missing alpha values
                 # but use the data as-is otherwise.
-                buf_col = np.ones((numVertices, 4))
+                buf_col = np.ones((numVertices, 4), np.float32)
                 tmp = np.reshape(buf_rgb, (len(buf_rgb) // 3, 3))
-                buf_col[:, :3] = tmp / 255
+                np.multiply(tmp, 1 / 255, out=buf_col[:, :3])
                 del tmp
             else:
                 # Neither a UV map nor vertices are available: create random
                 # colors.
-                buf_col = np.random.rand(4 * numVertices)
-
-            # Convert the vector to GPU compatible format.
-            buf_col = buf_col.astype(np.float32)
+                buf_col = np.random.rand(4 * numVertices).astype(np.float32)
 
             # Repeat with UV data. Each vertex has one associated (U,V)
             # pair to specify the position in the texture.
@@ -508,9 +556,11 @@ class ViewerWidget(QtOpenGL.QGLWidget):
             textureBuffer = gl.glGenTextures(1)
             gl.glBindTexture(gl.GL_TEXTURE_2D, textureBuffer)
 
-            # Upload texture to GPU (transpose the image first).
+            # Upload texture to GPU (transpose the image first). The
+            # transpose is only a view; copy it into one contiguous block
+            # here instead of leaving the conversion to PyOpenGL.
             buf_rgb = np.reshape(buf_rgb, (width, height, 3))
-            buf_rgb = buf_rgb.transpose((1, 0, 2))
+            buf_rgb = np.ascontiguousarray(buf_rgb.transpose((1, 0, 2)))
             gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGB, width, height,
                             0, gl.GL_RGB, gl.GL_UNSIGNED_BYTE, buf_rgb)
 
@@ -526,7 +576,7 @@ class ViewerWidget(QtOpenGL.QGLWidget):
 
     def _removeObjectData(self, objID):
         vars = (self.numVertices, self.vertex_array_object,
-                self.textureBuffer, self.newSVs)
+                self.textureBuffer, self.fragModelCache, self.newSVs)
         for v in vars:
             if objID in v:
                 del v[objID]
@@ -545,11 +595,9 @@ class ViewerWidget(QtOpenGL.QGLWidget):
 
         # Remove all *None* entries (means Azrael does not know about them;
         # should be impossible but just to be sure).
-        self.newSVs = {}
-        for objID in ret.data:
-            if ret.data[objID] is None:
-                self._removeObjectData(objID)
-            self.newSVs[objID] = ret.data[objID]
+        self.newSVs = {k: v for k, v in ret.data.items() if v is not None}
+        for objID in ret.data.keys() - self.newSVs.keys():
+            self._removeObjectData(objID)
 
         # Remove all objects from the local scene for which Azrael did not
         # provid SV data.
@@ -567,9 +615,10 @@ class ViewerWidget(QtOpenGL.QGLWidget):
             self._removeObjectData(objID)
 
         # The previous loop removed objects that do not exist anymore in
-        # Azrael. This loop adds objects that now exist in Azrael but not yet
-        # in our scene.
-        for objID in list(self.newSVs.keys()):
+        # Azrael. The code below adds objects that now exist in Azrael but not
+        # yet in our scene. First, compile the list of these objects.
+        objIDs = []
+        for objID in self.newSVs:
             # Do not add anything if it is the player object itself.
             if objID == self.player_id:
                 continue
@@ -578,20 +627,27 @@ class ViewerWidget(QtOpenGL.QGLWidget):
             # changed.
             if (objID in self.oldSVs) and not self.hasGeometryChanged(objID):
                 continue
-
-            # Download the latest geometry for this object; skip it if the
-            # object does not exist (anymore).
-            ret = self.client.getFragments([objID])
-            if not ret.ok or ret.data is None or ret.data[objID] is None:
+            objIDs.append(objID)
+
+        # Fetch the fragment meta data for all these objects in one request.
+        frags = {}
+        if len(objIDs) > 0:
+            ret = self.client.getFragments(objIDs)
+            if ret.ok and ret.data is not None:
+                frags = ret.data
+
+        base_url = 'http://{}:{}'.format(self.addr_clerk, self.port_webapi)
+        for objID in objIDs:
+            # Skip the object if it does not exist (anymore).
+            if frags.get(objID) is None:
                 self._removeObjectData(objID)
                 continue
 
             # Fetch fragment model from Azrael and pass it to the GPU.
-            base_url = 'http://{}:{}'.format(self.addr_clerk, self.port_webapi)
-            for fragID, frag_data in ret.data[objID].items():
+            for fragID, frag_data in frags[objID].items():
                 if frag_data['fragtype'] == 'RAW':
                     url = base_url + frag_data['url_frag'] + '/model.json'
-                    frag = requests.get(url).content
+                    frag = self.http.get(url).content
                     if len(frag) == 0:
                         self._removeObjectData(objID)
                         break
@@ -602,27 +658,27 @@ class ViewerWidget(QtOpenGL.QGLWidget):
                     )
                 elif frag_data['fragtype'] == 'DAE':
                     url = base_url + frag_data['url_frag'] + '/' + fragID
-                    frag = requests.get(url).content
+                    frag = self.http.get(url).content
                     if len(frag) == 0:
                         self._removeObjectData(objID)
                         break
+                    # AssImp can only import files, so write the model into
+                    # a temporary directory first.
                     with tempfile.TemporaryDirectory() as tmpdir:
-                        open('model.dae', 'wb').write(frag)
-                        mesh = model_import.loadModelAll('model.dae')
+                        fname = os.path.join(tmpdir, 'model.dae')
+                        with open(fname, 'wb') as fp:
+                            fp.write(frag)
+                        mesh = model_import.loadModelAll(fname)
+                        del fname
 
                     # The model may contain several sub-models. Each one has a
                     # set of vertices, UV- and texture maps. The following code
                     # simply flattens the three list-of-lists into three plain
-                    # lists.
-                    vert = np.array(mesh['vertices']).flatten()
-                    uv = np.array(mesh['UV']).flatten()
-                    rgb = np.array(mesh['RGB']).flatten()
+                    # lists in the correct format.
+                    vert = np.array(mesh['vertices']).ravel()
+                    uv = np.array(mesh['UV'], np.float32).ravel()
+                    rgb = np.array(mesh['RGB'], np.uint8).ravel()
                     width = height = None
-
-                    # Ensure the data has the correct format.
-                    vert = np.array(vert)
-                    uv = np.array(uv, np.float32)
-                    rgb = np.array(rgb, np.uint8)
                     frag = getFragMetaRaw(vert, uv, rgb, width, height)
                 elif frag_data['fragtype'] == '3JS_V3':
                     # Model files in 3JS format. These are stored in a main
@@ -636,7 +692,7 @@ class ViewerWidget(QtOpenGL.QGLWidget):
 
                     # Download the model.
                     url = base_url + frag_data['url_frag'] + '/' + fnames[0]
-                    frag = requests.get(url).content
+                    frag = self.http.get(url).content
                     if len(frag) == 0:
                         self._removeObjectData(objID)
                         break
@@ -650,16 +706,14 @@ class ViewerWidget(QtOpenGL.QGLWidget):
                     if len(fnames) > 0:
                         print('found texture')
                         url = base_url + frag_data['url_frag'] + '/' + fnames[0]
-                        texture = requests.get(url).content
+                        texture = self.http.get(url).content
                         assert len(texture) > 0
-                        with tempfile.TemporaryDirectory() as tmpdir:
-                            open('texture.jpg', 'wb').write(texture)
-                            img = PIL.Image.open(fnames[0])
-                            width, height = img.size
-                            img = np.array(img)
-                            rgb = np.rollaxis(np.flipud(img), 1).flatten()
-                            print('imported texture {}'.format(url))
-                            del img
+                        img = PIL.Image.open(io.BytesIO(texture))
+                        width, height = img.size
+                        img = np.array(img)
+                        rgb = np.rollaxis(np.flipud(img), 1).flatten()
+                        print('imported texture {}'.format(url))
+                        del img
                         del url, texture
                     del fnames
 
@@ -756,6 +810,10 @@ class ViewerWidget(QtOpenGL.QGLWidget):
 
         print('Client connected')
 
+        # Re-use one HTTP connection for all model downloads instead of
+        # opening a new one for every file.
+        self.http = requests.Session()
+
         # Define a template for projectiles.
         self.defineProjectileTemplate()
 
@@ -784,6 +842,8 @@ class ViewerWidget(QtOpenGL.QGLWidget):
         self.vertex_array_object = {}
         self.textureBuffer = {}
         self.shaderDict = {}
+        self.uniformLoc = {}
+        self.fragModelCache = {}
 
         # Background color.
         gl.glClearColor(0, 0, 0, 0)
@@ -798,23 +858,28 @@ class ViewerWidget(QtOpenGL.QGLWidget):
         fs = os.path.join(fdir, 'shaders/uv.fs')
         self.shaderDict['uv'] = self.linkShaders(vs, fs)
 
+        # The locations of the Uniform variables never change. Query them
+        # once for each shader program instead of for every draw call.
+        for program in self.shaderDict.values():
+            self.uniformLoc[program] = (
+                gl.glGetUniformLocation(program, b'projection_matrix'),
+                gl.glGetUniformLocation(program, b'model_matrix'),
+            )
+
         # Load and compile all objects.
         self.loadGeometry()
 
     def buildModelMatrix(self, frag):
-        # Build the scaling matrix for the overall object. The
-        # lower-right entry must be 1.
-        matScaleObj = frag['scale'] * np.eye(4)
-        matScaleObj[3, 3] = 1
-
-        # Convert the object Quaternion into a rotation matrix.
+        # The model matrix is the product of translation, rotation, and
+        # scaling matrix. Fill its blocks directly instead of multiplying the
+        # three 4x4 matrices: the upper left 3x3 block is the scaled rotation
+        # matrix and the last column holds the position. Use the 32Bit format
+        # the GPU expects right away.
         q = frag['rotation']
-        matRotObj = util.Quaternion(*q).toMatrix()
-
-        # Build the model matrix for the overall object.
-        matModelObj = np.eye(4)
+        matModelObj = np.eye(4, dtype=np.float32)
+        matModelObj[:3, :3] = util.Quaternion(*q).toMatrix()[:3, :3]
+        matModelObj[:3, :3] *= frag['scale']
         matModelObj[:3, 3] = frag['position']
-        matModelObj = np.dot(matModelObj, np.dot(matRotObj, matScaleObj))
         return matModelObj
 
     def paintGL(self):
@@ -852,37 +917,46 @@ class ViewerWidget(QtOpenGL.QGLWidget):
         # Clear the scene.
         gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
 
-        # Compute the combined camera- and projection matrix.
+        # Compute the combined camera- and projection matrix. This happens
+        # once per frame; all objects and fragments share the result.
         cameraMat = self.camera.cameraMatrix()
-        matPerspCam = np.array(np.dot(self.matPerspective, cameraMat))
+        matPerspCam = np.dot(self.matPerspective, cameraMat)
 
-        # Convert it to the flat 32Bit format the GPU expects.
+        # Convert it to the 32Bit format the GPU expects.
         matPerspCam = matPerspCam.astype(np.float32)
-        matPerspCam = matPerspCam.flatten(order='F')
 
-        with util.Timeit('viewer.loop') as timeit:
-            for objID in self.newSVs:
-                # Do not add anything if it is the player object itself.
-                if objID == self.player_id:
-                    continue
-
-                # Compute the model matrix for the overall object.
-                body = self.newSVs[objID]['rbs']
-                tmp = {
-                    'scale': body['scale'],
-                    'position': body['position'],
-                    'rotation': body['rotation']
-                }
-                matModelObj = self.buildModelMatrix(tmp)
-                del body, tmp
+        # Upload the matrix once to every shader program. The programs retain
+        # the value for all draw calls of this frame. All matrices are stored
+        # in row-major order, hence the GL_TRUE flag to let OpenGL transpose
+        # them instead of NumPy.
+        for program, (h_prjMat, _) in self.uniformLoc.items():
+            gl.glUseProgram(program)
+            gl.glUniformMatrix4fv(h_prjMat, 1, gl.GL_TRUE, matPerspCam)
+
+        # Compute the model matrices for all objects at once. Do not add
+        # anything for the player object itself.
+        objIDs = [_ for _ in self.newSVs if _ != self.player_id]
+        bodies = [self.newSVs[_]['rbs'] for _ in objIDs]
+        matModelObjs = modelMatrices(
+            [_['scale'] for _ in bodies],
+            [_['position'] for _ in bodies],
+            [_['rotation'] for _ in bodies],
+        )
+        del bodies
 
+        with util.Timeit('viewer.loop') as timeit:
+            for objID, matModelObj in zip(objIDs, matModelObjs):
                 # Update each fragment in the scene based on the position,
                 # rotation, and scale of the overall object.
-                self._drawFragments(objID, matModelObj, matPerspCam)
+                self._drawFragments(objID, matModelObj)
 
         # --------------------------------------------------------------------
         # Display HUD for this frame.
         # --------------------------------------------------------------------
+        # Unbind the VAO and texture of the last fragment. The draw loop
+        # leaves them bound because every fragment binds its own anyway.
+        gl.glBindVertexArray(0)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
         gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
         gl.glUseProgram(0)
         gl.glColor3f(0.5, 0.5, 0.5)
@@ -906,21 +980,31 @@ class ViewerWidget(QtOpenGL.QGLWidget):
             del t0, img, elapsed
         self.frameCnt += 1
 
-    def _drawFragments(self, objID, matModelObj, matPerspCam):
+    def _drawFragments(self, objID, matModelObj):
         """
         Instruct the GPU to draw each fragment of ``objID``.
 
-        The ``matModelObj`` and ``matPerspCam`` matrices will compute the world
-        coordinates for the object. However, fragments are defined purely in
-        object coordinate. This function will therefore scale, move, and rotate
-        each fragment before it applies the world coordinate transformation.
+        The ``matModelObj`` matrix and the projection matrix (already
+        uploaded by ``_paintGL``) will compute the world coordinates for the
+        object. However, fragments are defined purely in object coordinate.
+        This function will therefore scale, move, and rotate each fragment
+        before it applies the world coordinate transformation.
         """
         frags = self.newSVs[objID]['frag']
+        fragModelCache = self.fragModelCache.setdefault(objID, {})
+
+        # Look up the GPU handles of this object only once for all fragments.
+        textureBuffer = self.textureBuffer[objID]
+        vertex_array_object = self.vertex_array_object[objID]
+        numVerticesObj = self.numVertices[objID]
+
+        # Only switch shader programs when the fragment needs a different one.
+        shader_active = None
         for fragID, frag in frags.items():
             # Convenience.
-            textureHandle = self.textureBuffer[objID][fragID]
-            VAO = self.vertex_array_object[objID][fragID]
-            numVertices = self.numVertices[objID][fragID]
+            textureHandle = textureBuffer[fragID]
+            VAO = vertex_array_object[fragID]
+            numVertices = numVerticesObj[fragID]
 
             # Activate the shader depending on whether or not we have a texture
             # for the current object.
@@ -929,23 +1013,25 @@ class ViewerWidget(QtOpenGL.QGLWidget):
             else:
                 shader = self.shaderDict['uv']
 
-            # Compute the model matrix for the fragment.
-            matModelFrag = self.buildModelMatrix(frag)
+            # Compute the model matrix for the fragment, unless its scale,
+            # position, and rotation are the same as in the previous frame.
+            key = (frag['scale'], tuple(frag['position']),
+                   tuple(frag['rotation']))
+            cached = fragModelCache.get(fragID)
+            if cached is None or cached[0] != key:
+                cached = (key, self.buildModelMatrix(frag))
+                fragModelCache[fragID] = cached
+            matModelFrag = cached[1]
 
             # Combine the model matrix of the fragment and the overall object.
+            # Both are already in the 32Bit format the GPU expects.
             matModelAll = np.dot(matModelObj, matModelFrag)
 
-            # Convert it to the flat 32Bit format the GPU expects.
-            matModelAll = matModelAll.astype(np.float32)
-            matModelAll = matModelAll.flatten(order='F')
-
-            # Activate the shader and obtain handles to Uniform variables.
-            gl.glUseProgram(shader)
-            tmp1 = 'projection_matrix'.encode('utf8')
-            tmp2 = 'model_matrix'.encode('utf8')
-            h_prjMat = gl.glGetUniformLocation(shader, tmp1)
-            h_modMat = gl.glGetUniformLocation(shader, tmp2)
-            del tmp1, tmp2
+            # Activate the shader and look up the handle to its model matrix.
+            if shader != shader_active:
+                gl.glUseProgram(shader)
+                shader_active = shader
+            h_modMat = self.uniformLoc[shader][1]
 
             # Activate the VAO and shader program.
             gl.glBindVertexArray(VAO)
@@ -955,21 +1041,12 @@ class ViewerWidget(QtOpenGL.QGLWidget):
                 gl.glBindTexture(gl.GL_TEXTURE_2D, textureHandle)
                 gl.glActiveTexture(gl.GL_TEXTURE0)
 
-            # Upload the model- and projection matrices to the GPU.
-            gl.glUniformMatrix4fv(h_modMat, 1, gl.GL_FALSE, matModelAll)
-            gl.glUniformMatrix4fv(h_prjMat, 1, gl.GL_FALSE, matPerspCam)
+            # Upload the model matrix to the GPU.
+            gl.glUniformMatrix4fv(h_modMat, 1, gl.GL_TRUE, matModelAll)
 
-            # Draw all triangles.
-            gl.glEnableVertexAttribArray(0)
-            gl.glEnableVertexAttribArray(1)
+            # Draw all triangles. The VAO already has both vertex attribute
+            # arrays enabled (see upload2GPU).
             gl.glDrawArrays(gl.GL_TRIANGLES, 0, numVertices)
-            if textureHandle is not None:
-                gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
-
-            # Unbind the entire VAO.
-            gl.glDisableVertexAttribArray(1)
-            gl.glDisableVertexAttribArray(0)
-            gl.glBindVertexArray(0)
 
     def resizeGL(self, width, height):
         """
@@ -981,8 +1058,10 @@ class ViewerWidget(QtOpenGL.QGLWidget):
         """
         Compile the ``shader_type`` stored in the file ``fname``.
         """
+        with open(fname) as fp:
+            source = fp.read()
         shader = gl.glCreateShader(shader_type)
-        gl.glShaderSource(shader, open(fname).read())
+        gl.glShaderSource(shader, source)
         gl.glCompileShader(shader)
 
         # Check for shader compilation errors.
@@ -1026,13 +1105,17 @@ class ViewerWidget(QtOpenGL.QGLWidget):
         if self.movement['left']:
             self.camera.strafeLeft()
 
-        pos = self.camera.position
-        cs = CollShapeBox(1, 1, 1)
-        cs = CollShapeMeta('box', (0, 0, 0), (0, 0, 0, 1), cs)
-        attr = {'position': pos.tolist(), 'cshapes': {'player': cs}}
+        # Move the player object to the camera position, unless the latest
+        # state variables from Azrael already have it there.
         if self.show_player:
-            assert self.client.setRigidBodyData({self.player_id: attr}).ok
-        del cs
+            pos = self.camera.position.tolist()
+            sv = self.newSVs.get(self.player_id)
+            if (sv is None) or (list(sv['rbs']['position']) != pos):
+                attr = {'position': pos, 'cshapes': {'player': self.cs_player}}
+                ret = self.client.setRigidBodyData({self.player_id: attr})
+                assert ret.ok
+                del attr, ret
+            del pos, sv
 
         # Do not update the camera rotation if the mouse is not grabbed.
         if not self.mouseGrab:
@@ -1180,8 +1263,13 @@ class ViewerWidget(QtOpenGL.QGLWidget):
             self.lastFrameCnt = self.frameCnt
             self.lastFrameTime = time.time()
 
-        self.killTimer(event.timerId())
-        self.drawTimer = self.startTimer(20)
+        # Switch from the initial start-up delay to the regular frame
+        # interval after the first tick. Afterwards, keep re-using the same
+        # timer instead of creating a new one for every frame.
+        if self.drawTimerInitial:
+            self.killTimer(event.timerId())
+            self.drawTimer = self.startTimer(20)
+            self.drawTimerInitial = False
         self.updateGL()
         self.removeProjectiles()
 
@@ -210,31 +210,32 @@ def typecheck(func_handle):
             print(msg)
             raise TypeError(*args)
 
-    @functools.wraps(func_handle)
-    def wrapper(*args, **kwds):
-        # Retrieve information about all arguments passed to the function,
-        # as well as their annotations in the function signature.
-        argspec = inspect.getfullargspec(func_handle)
-
-        # Convert all variable annotations that were not specified as a
-        # tuple or list into one, eg. str --> will become (str,)
-        annot = {}
-        for key, val in argspec.annotations.items():
-            if isinstance(val, tuple) or isinstance(val, list):
-                annot[key] = val
-            else:
-                annot[key] = val,       # Note the trailing colon!
-
-        # Prefix the argspec.defaults tuple with **None** elements to make
-        # its length equal to the number of variables (for sanity in the
-        # code below). Since **None** types are always ignored by this
-        # decorator this change is neutral.
-        if argspec.defaults is None:
-            defaults = tuple([None] * len(argspec.args))
+    # Retrieve information about all arguments of the function, as well as
+    # their annotations in the function signature. These never change and
+    # are thus compiled only once here instead of on every call.
+    argspec = inspect.getfullargspec(func_handle)
+
+    # Convert all variable annotations that were not specified as a
+    # tuple or list into one, eg. str --> will become (str,)
+    annot = {}
+    for key, val in argspec.annotations.items():
+        if isinstance(val, tuple) or isinstance(val, list):
+            annot[key] = val
         else:
-            num_none = len(argspec.args) - len(argspec.defaults)
-            defaults = tuple([None] * num_none) + argspec.defaults
+            annot[key] = val,       # Note the trailing colon!
+
+    # Prefix the argspec.defaults tuple with **None** elements to make
+    # its length equal to the number of variables (for sanity in the
+    # code below). Since **None** types are always ignored by this
+    # decorator this change is neutral.
+    if argspec.defaults is None:
+        defaults = tuple([None] * len(argspec.args))
+    else:
+        num_none = len(argspec.args) - len(argspec.defaults)
+        defaults = tuple([None] * num_none) + argspec.defaults
 
+    @functools.wraps(func_handle)
+    def wrapper(*args, **kwds):
         # Shorthand for the number of unnamed arguments.
         ofs = len(args)
 
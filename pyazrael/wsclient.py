@@ -33,6 +33,7 @@ This client uses the Websocket library from
 https://github.com/liris/websocket-client
 """
 import time
+import socket
 import websocket
 
 import pyazrael.client
@@ -61,10 +62,15 @@ class WSClient(pyazrael.client.Client):
         # Websocket handle (will be initialised below).
         self.ws = None
 
+        # Disable Nagle's algorithm. Most requests are small and would
+        # otherwise be delayed until the server ACKs the previous packet.
+        sockopt = ((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),)
+
         # Make several attempts to establish the connection before giving up.
         for ii in range(5):
             try:
-                self.ws = websocket.create_connection(self.url, timeout)
+                self.ws = websocket.create_connection(
+                    self.url, timeout, sockopt=sockopt)
                 break
             except ConnectionRefusedError as err:
                 if ii >= 3: